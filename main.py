@@ -3,6 +3,10 @@ main.py
 Entry point for the Project Manager CLI tool.
 Run this file to start the application.
 
+The script's own folder is already first on sys.path when it is run,
+so no path setup is needed. After `pip install -e .` the same CLI is
+also available as the `project-manager` command.
+
 Usage:
     python main.py <command> [options]
 
@@ -16,16 +20,7 @@ Examples:
     python main.py complete-task --user "Alex" --project "CLI Tool" --task "Implement storage"
 """
 
-import sys
-import os
-
-
-
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-
-
 from project_manager.cli import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -5,45 +5,116 @@ Uses argparse for command structure and rich for styled terminal output.
 
 Available commands:
     add-user        --name --email
-    list-users
+    list-users      [--plain]
     add-project     --user --title --desc --due
-    list-projects   --user
+    list-projects   --user [--plain]
     add-task        --user --project --title --assign
-    list-tasks      --user --project
+    list-tasks      --user --project [--plain]
     complete-task   --user --project --task
+    shell           (reads the commands above from stdin, one per line)
 """
 
 import argparse
-from rich.console import Console
-from rich.table import Table
-from rich import box
-
-from project_manager import services
+import sys
 
 # ─────────────────────────────────────────────
 # RICH CONSOLE SETUP
 # ─────────────────────────────────────────────
 
-console = Console()  # global rich console used for all output
+_console = None  # global rich console, created on first use
+
+
+def _get_console():
+    """
+    Return the shared rich Console, creating it on first use.
+    rich is only imported once something is actually printed.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# Color-coded task status markup, built once at import instead of per row
+_STATUS_COLORS = {
+    "pending":     "yellow",
+    "in-progress": "cyan",
+    "complete":    "green"
+}
+_STATUS_MARKUP = {status: f"[{color}]{status}[/{color}]" for status, color in _STATUS_COLORS.items()}
 
 
 # ─────────────────────────────────────────────
 # OUTPUT HELPERS
 # ─────────────────────────────────────────────
 
+def _styled(message: str, style: str):
+    """
+    Build a rich Text with the style applied directly.
+    Printing a Text skips rich's markup parser, and square brackets in
+    user-supplied names can't be mistaken for markup tags.
+    """
+    from rich.text import Text
+    return Text(message, style=style)
+
+
 def print_success(message: str):
     """Print a green success message."""
-    console.print(f"[bold green]✔ {message}[/bold green]")
+    _get_console().print(_styled(f"✔ {message}", "bold green"))
 
 
 def print_error(message: str):
     """Print a red error message."""
-    console.print(f"[bold red]✘ {message}[/bold red]")
+    _get_console().print(_styled(f"✘ {message}", "bold red"))
 
 
 def print_info(message: str):
     """Print a cyan info message."""
-    console.print(f"[cyan]{message}[/cyan]")
+    _get_console().print(_styled(message, "cyan"))
+
+
+# Namespace fields that belong to the CLI itself, not to the service call
+_CLI_ONLY_FIELDS = frozenset(("command", "plain"))
+
+
+def _service_kwargs(args) -> dict:
+    """
+    Return the parsed arguments as keyword arguments for a service call.
+    Each option's dest matches the service parameter name, and optional
+    options default to "" in the parser, so handlers need no per-field
+    unpacking or `or ""` coercion.
+    """
+    return {k: v for k, v in vars(args).items() if k not in _CLI_ONLY_FIELDS}
+
+
+def use_plain(args) -> bool:
+    """Return True when list output should skip rich (--plain or non-TTY stdout)."""
+    return args.plain or not sys.stdout.isatty()
+
+
+def write_plain(headers: tuple, rows: list):
+    """
+    Write rows as a plain-text table in a single write call.
+    Columns are left-justified to their widest cell; no rich import,
+    markup parsing, or terminal measurement is involved.
+
+    Args:
+        headers (tuple): Column names for the first line.
+        rows (list): Tuples of already-stringified cell values.
+    """
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    last = len(headers) - 1
+    lines = [
+        "  ".join(cell if i == last else cell.ljust(widths[i]) for i, cell in enumerate(line))
+        for line in [headers, *rows]
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ─────────────────────────────────────────────
@@ -55,7 +126,8 @@ def handle_add_user(args):
     Handle the add-user command.
     Creates a new user with the given name and email.
     """
-    result = services.add_user(name=args.name, email=args.email)
+    from project_manager import services
+    result = services.add_user(**_service_kwargs(args))
     if result["success"]:
         print_success(result["message"])
     else:
@@ -67,12 +139,22 @@ def handle_list_users(args):
     Handle the list-users command.
     Displays all users in a rich table.
     """
-    result = services.list_users()
+    from project_manager import services
+    result = services.list_users(**_service_kwargs(args))
 
     if not result["success"]:
         print_error(result["message"])
         return
 
+    rows = result["data"]  # display-ready tuples from the service layer
+
+    if use_plain(args):
+        write_plain(("ID", "Name", "Email", "Projects"), rows)
+        return
+
+    from rich.table import Table
+    from rich import box
+
     # Build a rich table
     table = Table(title="👥 All Users", box=box.ROUNDED, highlight=True)
     table.add_column("ID",      style="dim",          width=6)
@@ -80,15 +162,11 @@ def handle_list_users(args):
     table.add_column("Email",   style="cyan",         min_width=20)
     table.add_column("Projects",style="magenta",      width=10)
 
-    for user in result["data"]:
-        table.add_row(
-            str(user.id),
-            user.name,
-            user.email,
-            str(len(user.projects))
-        )
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
-    console.print(table)
+    _get_console().print(table)
 
 
 def handle_add_project(args):
@@ -96,12 +174,8 @@ def handle_add_project(args):
     Handle the add-project command.
     Adds a new project to the specified user.
     """
-    result = services.add_project(
-        username=args.user,
-        title=args.title,
-        description=args.desc or "",
-        due_date=args.due or ""
-    )
+    from project_manager import services
+    result = services.add_project(**_service_kwargs(args))
     if result["success"]:
         print_success(result["message"])
     else:
@@ -113,29 +187,34 @@ def handle_list_projects(args):
     Handle the list-projects command.
     Displays all projects for a given user in a rich table.
     """
-    result = services.list_projects(username=args.user)
+    from project_manager import services
+    result = services.list_projects(**_service_kwargs(args))
 
     if not result["success"]:
         print_error(result["message"])
         return
 
-    table = Table(title=f"📁 Projects for '{args.user}'", box=box.ROUNDED, highlight=True)
+    rows = result["data"]
+
+    if use_plain(args):
+        write_plain(("ID", "Title", "Description", "Due Date", "Tasks"), rows)
+        return
+
+    from rich.table import Table
+    from rich import box
+
+    table = Table(title=f"📁 Projects for '{args.username}'", box=box.ROUNDED, highlight=True)
     table.add_column("ID",          style="dim",        width=6)
     table.add_column("Title",       style="bold white", min_width=20)
     table.add_column("Description", style="white",      min_width=25)
     table.add_column("Due Date",    style="yellow",     width=12)
     table.add_column("Tasks",       style="magenta",    width=8)
 
-    for project in result["data"]:
-        table.add_row(
-            str(project.id),
-            project.title,
-            project.description or "—",
-            project.due_date or "—",
-            str(len(project.tasks))
-        )
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
-    console.print(table)
+    _get_console().print(table)
 
 
 def handle_add_task(args):
@@ -143,12 +222,8 @@ def handle_add_task(args):
     Handle the add-task command.
     Adds a task to a project belonging to the specified user.
     """
-    result = services.add_task(
-        username=args.user,
-        project_title=args.project,
-        title=args.title,
-        assigned_to=args.assign or ""
-    )
+    from project_manager import services
+    result = services.add_task(**_service_kwargs(args))
     if result["success"]:
         print_success(result["message"])
     else:
@@ -160,35 +235,33 @@ def handle_list_tasks(args):
     Handle the list-tasks command.
     Displays all tasks for a given project in a rich table.
     """
-    result = services.list_tasks(username=args.user, project_title=args.project)
+    from project_manager import services
+    result = services.list_tasks(**_service_kwargs(args))
 
     if not result["success"]:
         print_error(result["message"])
         return
 
-    # Color-code status
-    status_colors = {
-        "pending":     "yellow",
-        "in-progress": "cyan",
-        "complete":    "green"
-    }
+    rows = result["data"]
+
+    if use_plain(args):
+        write_plain(("ID", "Title", "Assigned To", "Status"), rows)
+        return
+
+    from rich.table import Table
+    from rich import box
 
-    table = Table(title=f"✅ Tasks in '{args.project}'", box=box.ROUNDED, highlight=True)
+    table = Table(title=f"✅ Tasks in '{args.project_title}'", box=box.ROUNDED, highlight=True)
     table.add_column("ID",          style="dim",        width=6)
     table.add_column("Title",       style="bold white", min_width=25)
     table.add_column("Assigned To", style="cyan",       min_width=15)
     table.add_column("Status",      min_width=12)
 
-    for task in result["data"]:
-        color = status_colors.get(task.status, "white")
-        table.add_row(
-            str(task.id),
-            task.title,
-            task.assigned_to or "—",
-            f"[{color}]{task.status}[/{color}]"
-        )
+    add_row = table.add_row
+    for task_id, title, assigned_to, status in rows:
+        add_row(task_id, title, assigned_to, _STATUS_MARKUP.get(status) or f"[white]{status}[/white]")
 
-    console.print(table)
+    _get_console().print(table)
 
 
 def handle_complete_task(args):
@@ -196,80 +269,190 @@ def handle_complete_task(args):
     Handle the complete-task command.
     Marks the specified task as complete.
     """
-    result = services.complete_task(
-        username=args.user,
-        project_title=args.project,
-        task_title=args.task
-    )
+    from project_manager import services
+    result = services.complete_task(**_service_kwargs(args))
     if result["success"]:
         print_success(result["message"])
     else:
         print_error(result["message"])
 
 
-# ─────────────────────────────────────────────
-# CLI SETUP
-# ─────────────────────────────────────────────
-
-def build_parser() -> argparse.ArgumentParser:
+def handle_shell(args):
     """
-    Build and return the argparse CLI parser with all subcommands.
-
-    Returns:
-        argparse.ArgumentParser: Fully configured parser.
+    Handle the shell command.
+    Reads one command per line from stdin and dispatches it to the same
+    handlers, so a single process (and its JIT, when run under PyPy)
+    stays warm across many operations. Blank lines and lines starting
+    with '#' are skipped; 'exit', 'quit' or EOF ends the session.
+    Each command's changes are written before the next line is read, so
+    an idle or killed session doesn't hold unsaved work.
     """
-    parser = argparse.ArgumentParser(
-        prog="project-manager",
-        description="🛠  A CLI tool for managing users, projects, and tasks.",
-        formatter_class=argparse.RawTextHelpFormatter
-    )
+    import shlex
+    from project_manager import services
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    subparsers.required = True  # show help if no command is given
+    parser = build_parser()
+    prompt = "project-manager> " if sys.stdin.isatty() else ""
+
+    while True:
+        try:
+            line = input(prompt).strip()
+        except EOFError:
+            break
+
+        if not line or line.startswith("#"):
+            continue
+        if line in ("exit", "quit"):
+            break
+
+        try:
+            sub_args = parser.parse_args(shlex.split(line))
+        except ValueError as e:  # e.g. unbalanced quotes
+            print_error(f"Could not parse command: {e}")
+            continue
+        except SystemExit:
+            continue  # argparse already printed the usage or help text
+
+        if sub_args.command == "shell":
+            print_error("Already in the shell.")
+            continue
+
+        try:
+            _COMMANDS[sub_args.command](sub_args)
+        except Exception as e:
+            print_error(f"Unexpected error: {e}")
+        services.flush()
+
+
+# Subcommand name → handler, looked up directly after parsing
+_COMMANDS = {
+    "add-user":      handle_add_user,
+    "list-users":    handle_list_users,
+    "add-project":   handle_add_project,
+    "list-projects": handle_list_projects,
+    "add-task":      handle_add_task,
+    "list-tasks":    handle_list_tasks,
+    "complete-task": handle_complete_task,
+    "shell":         handle_shell,
+}
 
-    # ── add-user ──────────────────────────────
+
+# ─────────────────────────────────────────────
+# CLI SETUP
+# ─────────────────────────────────────────────
+
+def _register_add_user(subparsers):
+    """Register the add-user subcommand."""
     p_add_user = subparsers.add_parser("add-user", help="Create a new user")
     p_add_user.add_argument("--name",  required=True, help="User's full name")
     p_add_user.add_argument("--email", required=True, help="User's email address")
-    p_add_user.set_defaults(func=handle_add_user)
 
-    # ── list-users ────────────────────────────
+
+def _register_list_users(subparsers):
+    """Register the list-users subcommand."""
     p_list_users = subparsers.add_parser("list-users", help="List all users")
-    p_list_users.set_defaults(func=handle_list_users)
+    p_list_users.add_argument("--plain", action="store_true", help="Plain-text output (default when piped)")
 
-    # ── add-project ───────────────────────────
+
+def _register_add_project(subparsers):
+    """Register the add-project subcommand."""
     p_add_proj = subparsers.add_parser("add-project", help="Add a project to a user")
-    p_add_proj.add_argument("--user",  required=True, help="Name of the user")
+    p_add_proj.add_argument("--user",  dest="username", metavar="USER", required=True, help="Name of the user")
     p_add_proj.add_argument("--title", required=True, help="Project title")
-    p_add_proj.add_argument("--desc",  required=False, help="Project description")
-    p_add_proj.add_argument("--due",   required=False, help="Due date (e.g. 2025-12-31)")
-    p_add_proj.set_defaults(func=handle_add_project)
+    p_add_proj.add_argument("--desc",  dest="description", metavar="DESC", default="", help="Project description")
+    p_add_proj.add_argument("--due",   dest="due_date", metavar="DUE", default="", help="Due date (e.g. 2025-12-31)")
+
 
-    # ── list-projects ─────────────────────────
+def _register_list_projects(subparsers):
+    """Register the list-projects subcommand."""
     p_list_proj = subparsers.add_parser("list-projects", help="List all projects for a user")
-    p_list_proj.add_argument("--user", required=True, help="Name of the user")
-    p_list_proj.set_defaults(func=handle_list_projects)
+    p_list_proj.add_argument("--user", dest="username", metavar="USER", required=True, help="Name of the user")
+    p_list_proj.add_argument("--plain", action="store_true", help="Plain-text output (default when piped)")
+
 
-    # ── add-task ──────────────────────────────
+def _register_add_task(subparsers):
+    """Register the add-task subcommand."""
     p_add_task = subparsers.add_parser("add-task", help="Add a task to a project")
-    p_add_task.add_argument("--user",    required=True, help="Name of the user who owns the project")
-    p_add_task.add_argument("--project", required=True, help="Project title")
+    p_add_task.add_argument("--user",    dest="username", metavar="USER", required=True, help="Name of the user who owns the project")
+    p_add_task.add_argument("--project", dest="project_title", metavar="PROJECT", required=True, help="Project title")
     p_add_task.add_argument("--title",   required=True, help="Task title")
-    p_add_task.add_argument("--assign",  required=False, help="Name of person assigned to the task")
-    p_add_task.set_defaults(func=handle_add_task)
+    p_add_task.add_argument("--assign",  dest="assigned_to", metavar="ASSIGN", default="", help="Name of person assigned to the task")
 
-    # ── list-tasks ────────────────────────────
+
+def _register_list_tasks(subparsers):
+    """Register the list-tasks subcommand."""
     p_list_tasks = subparsers.add_parser("list-tasks", help="List all tasks in a project")
-    p_list_tasks.add_argument("--user",    required=True, help="Name of the user")
-    p_list_tasks.add_argument("--project", required=True, help="Project title")
-    p_list_tasks.set_defaults(func=handle_list_tasks)
+    p_list_tasks.add_argument("--user",    dest="username", metavar="USER", required=True, help="Name of the user")
+    p_list_tasks.add_argument("--project", dest="project_title", metavar="PROJECT", required=True, help="Project title")
+    p_list_tasks.add_argument("--plain",   action="store_true", help="Plain-text output (default when piped)")
+
 
-    # ── complete-task ─────────────────────────
+def _register_complete_task(subparsers):
+    """Register the complete-task subcommand."""
     p_complete = subparsers.add_parser("complete-task", help="Mark a task as complete")
-    p_complete.add_argument("--user",    required=True, help="Name of the user")
-    p_complete.add_argument("--project", required=True, help="Project title")
-    p_complete.add_argument("--task",    required=True, help="Task title to mark complete")
-    p_complete.set_defaults(func=handle_complete_task)
+    p_complete.add_argument("--user",    dest="username", metavar="USER", required=True, help="Name of the user")
+    p_complete.add_argument("--project", dest="project_title", metavar="PROJECT", required=True, help="Project title")
+    p_complete.add_argument("--task",    dest="task_title", metavar="TASK", required=True, help="Task title to mark complete")
+
+
+def _register_shell(subparsers):
+    """Register the shell subcommand."""
+    subparsers.add_parser("shell", help="Run commands from stdin in one long-lived process")
+
+
+# Subcommand name → function that registers its subparser (in --help order)
+_SUBCOMMANDS = {
+    "add-user":      _register_add_user,
+    "list-users":    _register_list_users,
+    "add-project":   _register_add_project,
+    "list-projects": _register_list_projects,
+    "add-task":      _register_add_task,
+    "list-tasks":    _register_list_tasks,
+    "complete-task": _register_complete_task,
+    "shell":         _register_shell,
+}
+
+
+def _sniff_subcommand(argv: list):
+    """
+    Detect which subcommand the user asked for without running argparse.
+
+    The top-level parser takes no options besides -h/--help, so the
+    subcommand can only be the first token.
+
+    Args:
+        argv (list): Command-line arguments, excluding the program name.
+
+    Returns:
+        str or None: The subcommand name, or None if it can't be determined.
+    """
+    if argv and argv[0] in _SUBCOMMANDS:
+        return argv[0]
+    return None
+
+
+def build_parser(only: str = None) -> argparse.ArgumentParser:
+    """
+    Build and return the argparse CLI parser.
+
+    Args:
+        only (str, optional): Register just this subcommand instead of all
+                              of them (used once the subcommand is known).
+
+    Returns:
+        argparse.ArgumentParser: Fully configured parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="project-manager",
+        description="🛠  A CLI tool for managing users, projects, and tasks.",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    subparsers.required = True  # show help if no command is given
+
+    names = (only,) if only else _SUBCOMMANDS
+    for name in names:
+        _SUBCOMMANDS[name](subparsers)
 
     return parser
 
@@ -282,12 +465,15 @@ def main():
     """
     Main entry point for the CLI.
     Parses arguments and dispatches to the correct handler function.
+    Only the requested subcommand's parser is built; the full parser is
+    used for bare --help and unknown commands.
     """
-    parser = build_parser()
+    argv = sys.argv[1:]
+    parser = build_parser(only=_sniff_subcommand(argv))
 
     try:
-        args = parser.parse_args()
-        args.func(args)  
+        args = parser.parse_args(argv)
+        _COMMANDS[args.command](args)
     except KeyboardInterrupt:
         print_info("\nOperation cancelled by user.")
     except Exception as e:
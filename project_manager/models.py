@@ -8,6 +8,55 @@ Relationships:
     - Project has many Tasks (one-to-many)
 """
 
+import itertools
+import re
+import sys
+
+# Compiled once at import; used by the Person.email setter
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Every task status is interned, so the completed check can be an identity test
+_COMPLETE = sys.intern("complete")
+
+
+def _rekey(index: dict, old_key: str, new_key: str, item):
+    """Move item from old_key to new_key in a title index after a rename."""
+    if index.get(old_key) is item:
+        del index[old_key]
+    index.setdefault(new_key, item)
+
+
+def _clean_name(value: str) -> str:
+    """Return the name stripped of surrounding whitespace; raise ValueError if it is empty."""
+    if not value or not value.strip():
+        raise ValueError("Name cannot be empty.")
+    return value.strip()
+
+
+def _clean_email(value: str) -> str:
+    """Return the email stripped; raise ValueError unless it looks like name@domain.tld."""
+    value = value.strip()
+    if not _EMAIL_RE.match(value):
+        raise ValueError("Invalid email address. Expected the form name@domain.tld.")
+    return value
+
+
+def _slot_state(obj) -> dict:
+    """Pickle state for a slotted model: every slot except the to_dict() cache."""
+    return {
+        name: getattr(obj, name)
+        for cls in type(obj).__mro__
+        for name in getattr(cls, "__slots__", ())
+        if name != "_dict_cache"
+    }
+
+
+def _restore_slots(obj, state: dict):
+    """Restore state from _slot_state(), starting with an empty to_dict() cache."""
+    for name, value in state.items():
+        setattr(obj, name, value)
+    obj._dict_cache = None
+
 
 # ─────────────────────────────────────────────
 # BASE CLASS
@@ -20,9 +69,12 @@ class Person:
     User inherits from this class.
     """
 
+    __slots__ = ("_name", "_email", "_name_key")  # fixed attributes, no per-instance __dict__
+
     def __init__(self, name: str, email: str):
         """Initialize a Person with a name and email."""
         self._name = name
+        self._name_key = name.casefold()  # precomputed for case-insensitive lookups
         self._email = email
 
     # --- Properties ---
@@ -35,9 +87,18 @@ class Person:
     @name.setter
     def name(self, value: str):
         """Set name with validation — cannot be empty."""
-        if not value or not value.strip():
-            raise ValueError("Name cannot be empty.")
-        self._name = value.strip()
+        value = _clean_name(value)
+        old_key = self._name_key
+        self._name = value
+        self._name_key = self._name.casefold()
+        if self._name_key != old_key:
+            self._renamed()
+        self._invalidate()
+
+    @property
+    def name_key(self):
+        """Get the case-folded name used for case-insensitive matching."""
+        return self._name_key
 
     @property
     def email(self):
@@ -46,10 +107,15 @@ class Person:
 
     @email.setter
     def email(self, value: str):
-        """Set email with basic validation."""
-        if "@" not in value:
-            raise ValueError("Invalid email address. Must contain '@'.")
-        self._email = value.strip()
+        """Set email with validation — must look like name@domain.tld."""
+        self._email = _clean_email(value)
+        self._invalidate()
+
+    def _renamed(self):
+        """Hook called when name_key changes; subclasses keep name indexes in sync here."""
+
+    def _invalidate(self):
+        """Hook called after a change; subclasses drop cached serialized data here."""
 
     def __str__(self):
         return f"{self._name} <{self._email}>"
@@ -67,31 +133,42 @@ class User(Person):
     Represents a system user. Inherits from Person.
     Each user can own multiple projects.
 
-    Class Attribute:
-        _id_counter (int): Auto-increments to assign unique IDs.
+    Class Attributes:
+        _id_gen (itertools.count): Yields unique IDs for new instances.
+        rename_count (int): Bumped whenever a user's name_key changes, so
+                            name indexes kept outside the model (see
+                            services._user_index) know to rebuild.
     """
 
-    _id_counter = 1  # class-level ID counter (shared across all instances)
+    __slots__ = ("_id", "_projects", "_projects_by_title", "_dict_cache")
+
+    _id_gen = itertools.count(1)  # class-level ID generator (shared across all instances)
+    rename_count = 0
 
     def __init__(self, name: str, email: str, user_id: int = None):
         """
-        Initialize a User.
+        Initialize a User. A new user's name and email are validated as
+        the setters do (ValueError if invalid); users loaded from file
+        (user_id given) keep their stored values, so older data still loads.
 
         Args:
             name (str): User's full name.
             email (str): User's email address.
             user_id (int, optional): Manually set ID (used when loading from file).
         """
+        if user_id is None:
+            name, email = _clean_name(name), _clean_email(email)
         super().__init__(name, email)  # call Person's __init__
 
         # Assign ID — use provided one (from file) or auto-generate
         if user_id is not None:
             self._id = user_id
         else:
-            self._id = User._id_counter
-            User._id_counter += 1
+            self._id = next(User._id_gen)
 
         self._projects = []  # list of Project objects belonging to this user
+        self._projects_by_title = {}  # title.casefold() → Project, for O(1) lookups
+        self._dict_cache = None  # last to_dict() result, cleared on any change
 
     # --- Properties ---
 
@@ -116,21 +193,65 @@ class User(Person):
         """
         if not isinstance(project, Project):
             raise TypeError("Only Project instances can be added.")
+        self._append_project(project)
+
+    def _append_project(self, project):
+        """Append and index a project without the type check (used by from_dict)."""
         self._projects.append(project)
+        self._projects_by_title.setdefault(project._title_key, project)
+        project._owner = self
+        self._dict_cache = None
+
+    def _renamed(self):
+        """Record the rename so outside name indexes get rebuilt."""
+        User.rename_count += 1
+
+    def _invalidate(self):
+        """Drop the cached to_dict() result after a change."""
+        self._dict_cache = None
+
+    def reassign_id(self):
+        """
+        Give this user the next ID from the generator. Used by storage
+        when another process has already saved a user under this one's ID.
+        """
+        self._id = next(User._id_gen)
+        self._dict_cache = None
+
+    def find_project(self, title: str):
+        """
+        Find one of this user's projects by title (case-insensitive).
+
+        Args:
+            title (str): Project title to look for.
+
+        Returns:
+            Project or None: Matched project, or None if not found.
+        """
+        return self._projects_by_title.get(title.casefold())
+
+    def has_project(self, title: str) -> bool:
+        """Return True if this user already has a project with this title (case-insensitive)."""
+        return title.casefold() in self._projects_by_title
 
     def to_dict(self):
         """
         Serialize User to a dictionary for JSON storage.
+        The result is cached until the user or anything below it changes,
+        so unchanged projects and tasks are not rebuilt. Treat it as read-only.
 
         Returns:
             dict: User data as a plain dictionary.
         """
-        return {
-            "id": self._id,
-            "name": self._name,
-            "email": self._email,
-            "projects": [p.to_dict() for p in self._projects]
-        }
+        if self._dict_cache is None:
+            project_to_dict = Project.to_dict  # bind once instead of per element
+            self._dict_cache = {
+                "id": self._id,
+                "name": self._name,
+                "email": self._email,
+                "projects": [project_to_dict(p) for p in self._projects]
+            }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -149,15 +270,45 @@ class User(Person):
             user_id=data["id"]
         )
         # Rebuild nested projects
-        for p_data in data.get("projects", []):
-            user.add_project(Project.from_dict(p_data))
+        add = user._append_project  # objects are built here, skip the type check
+        project_from_dict = Project.from_dict
+        for p_data in data.get("projects", ()):
+            add(project_from_dict(p_data))
+
+        return user
+
+    @classmethod
+    def from_flat(cls, data: dict):
+        """
+        Build a User from a dictionary whose projects are already Project
+        objects (see storage's json object_hook, which builds the tree
+        bottom-up while parsing).
 
-        # Keep ID counter ahead of loaded IDs to avoid conflicts
-        if data["id"] >= User._id_counter:
-            User._id_counter = data["id"] + 1
+        Args:
+            data (dict): Dictionary with user data and built projects.
+
+        Returns:
+            User: Reconstructed User instance.
+        """
+        user = cls(
+            name=data["name"],
+            email=data["email"],
+            user_id=data["id"]
+        )
+        add = user._append_project
+        for project in data.get("projects", ()):
+            add(project)
 
         return user
 
+    def __getstate__(self):
+        """Pickle every slot except the to_dict() cache (see storage's snapshot)."""
+        return _slot_state(self)
+
+    def __setstate__(self, state):
+        """Restore a pickled user (see storage's snapshot)."""
+        _restore_slots(self, state)
+
     def __str__(self):
         return f"[User #{self._id}] {self._name} <{self._email}> | Projects: {len(self._projects)}"
 
@@ -175,10 +326,15 @@ class Project:
     Each project can have multiple tasks.
 
     Class Attribute:
-        _id_counter (int): Auto-increments to assign unique IDs.
+        _id_gen (itertools.count): Yields unique IDs for new instances.
     """
 
-    _id_counter = 1
+    __slots__ = (
+        "_id", "_title", "_title_key", "_description", "_due_date",
+        "_tasks", "_tasks_by_title", "_owner", "_dict_cache"
+    )
+
+    _id_gen = itertools.count(1)
 
     def __init__(self, title: str, description: str = "", due_date: str = "", project_id: int = None):
         """
@@ -191,15 +347,18 @@ class Project:
             project_id (int, optional): Manually set ID (used when loading from file).
         """
         self._title = title
+        self._title_key = title.casefold()  # precomputed for case-insensitive lookups
         self._description = description
         self._due_date = due_date
         self._tasks = []  # list of Task objects
+        self._tasks_by_title = {}  # title.casefold() → Task, for O(1) lookups
+        self._owner = None  # the User this project belongs to, set when it is added
+        self._dict_cache = None  # last to_dict() result, cleared on any change
 
         if project_id is not None:
             self._id = project_id
         else:
-            self._id = Project._id_counter
-            Project._id_counter += 1
+            self._id = next(Project._id_gen)
 
     # --- Properties ---
 
@@ -216,7 +375,12 @@ class Project:
         """Set title with validation."""
         if not value or not value.strip():
             raise ValueError("Project title cannot be empty.")
+        old_key = self._title_key
         self._title = value.strip()
+        self._title_key = self._title.casefold()
+        if self._owner is not None:
+            _rekey(self._owner._projects_by_title, old_key, self._title_key, self)
+        self._invalidate()
 
     @property
     def description(self):
@@ -225,6 +389,7 @@ class Project:
     @description.setter
     def description(self, value: str):
         self._description = value
+        self._invalidate()
 
     @property
     def due_date(self):
@@ -233,6 +398,7 @@ class Project:
     @due_date.setter
     def due_date(self, value: str):
         self._due_date = value
+        self._invalidate()
 
     @property
     def tasks(self):
@@ -249,17 +415,49 @@ class Project:
         """
         if not isinstance(task, Task):
             raise TypeError("Only Task instances can be added.")
+        self._append_task(task)
+
+    def _append_task(self, task):
+        """Append and index a task without the type check (used by from_dict)."""
         self._tasks.append(task)
+        self._tasks_by_title.setdefault(task._title_key, task)
+        task._owner = self
+        self._invalidate()
+
+    def _invalidate(self):
+        """Drop the cached to_dict() result here and in the owning user."""
+        self._dict_cache = None
+        if self._owner is not None:
+            self._owner._invalidate()
+
+    def find_task(self, title: str):
+        """
+        Find a task in this project by title (case-insensitive).
+
+        Args:
+            title (str): Task title to look for.
+
+        Returns:
+            Task or None: Matched task, or None if not found.
+        """
+        return self._tasks_by_title.get(title.casefold())
+
+    def has_task(self, title: str) -> bool:
+        """Return True if this project already has a task with this title (case-insensitive)."""
+        return title.casefold() in self._tasks_by_title
 
     def to_dict(self):
-        """Serialize Project to a dictionary for JSON storage."""
-        return {
-            "id": self._id,
-            "title": self._title,
-            "description": self._description,
-            "due_date": self._due_date,
-            "tasks": [t.to_dict() for t in self._tasks]
-        }
+        """Serialize Project to a dictionary for JSON storage (cached until changed)."""
+        if self._dict_cache is None:
+            task_to_dict = Task.to_dict
+            self._dict_cache = {
+                "id": self._id,
+                "title": self._title,
+                "description": self._description,
+                "due_date": self._due_date,
+                "tasks": [task_to_dict(t) for t in self._tasks]
+            }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -270,14 +468,36 @@ class Project:
             due_date=data.get("due_date", ""),
             project_id=data["id"]
         )
-        for t_data in data.get("tasks", []):
-            project.add_task(Task.from_dict(t_data))
+        add = project._append_task
+        task_from_dict = Task.from_dict
+        for t_data in data.get("tasks", ()):
+            add(task_from_dict(t_data))
 
-        if data["id"] >= Project._id_counter:
-            Project._id_counter = data["id"] + 1
+        return project
+
+    @classmethod
+    def from_flat(cls, data: dict):
+        """Build a Project from a dictionary whose tasks are already Task objects."""
+        project = cls(
+            title=data["title"],
+            description=data.get("description", ""),
+            due_date=data.get("due_date", ""),
+            project_id=data["id"]
+        )
+        add = project._append_task
+        for task in data.get("tasks", ()):
+            add(task)
 
         return project
 
+    def __getstate__(self):
+        """Pickle every slot except the to_dict() cache (see storage's snapshot)."""
+        return _slot_state(self)
+
+    def __setstate__(self, state):
+        """Restore a pickled project (see storage's snapshot)."""
+        _restore_slots(self, state)
+
     def __str__(self):
         status = f"{len(self._tasks)} task(s)"
         due = f" | Due: {self._due_date}" if self._due_date else ""
@@ -296,11 +516,13 @@ class Task:
     Represents a task within a project.
 
     Class Attribute:
-        _id_counter (int): Auto-increments to assign unique IDs.
+        _id_gen (itertools.count): Yields unique IDs for new instances.
     """
 
-    _id_counter = 1
-    VALID_STATUSES = ["pending", "in-progress", "complete"]
+    __slots__ = ("_id", "_title", "_title_key", "_assigned_to", "_status", "_owner", "_dict_cache")
+
+    _id_gen = itertools.count(1)
+    VALID_STATUSES = frozenset(map(sys.intern, ("pending", "in-progress", _COMPLETE)))  # O(1) membership checks
 
     def __init__(self, title: str, assigned_to: str = "", status: str = "pending", task_id: int = None):
         """
@@ -313,14 +535,18 @@ class Task:
             task_id (int, optional): Manually set ID (used when loading from file).
         """
         self._title = title
-        self._assigned_to = assigned_to
-        self._status = status
+        self._title_key = title.casefold()  # precomputed for case-insensitive lookups
+        # Statuses and assignee names repeat across many tasks — intern them so
+        # every task shares one string object and comparisons hit the identity fast path
+        self._assigned_to = sys.intern(assigned_to) if isinstance(assigned_to, str) else assigned_to
+        self._status = sys.intern(status) if isinstance(status, str) else status
+        self._owner = None  # the Project this task belongs to, set when it is added
+        self._dict_cache = None  # last to_dict() result, cleared on any change
 
         if task_id is not None:
             self._id = task_id
         else:
-            self._id = Task._id_counter
-            Task._id_counter += 1
+            self._id = next(Task._id_gen)
 
     # --- Properties ---
 
@@ -336,7 +562,12 @@ class Task:
     def title(self, value: str):
         if not value or not value.strip():
             raise ValueError("Task title cannot be empty.")
+        old_key = self._title_key
         self._title = value.strip()
+        self._title_key = self._title.casefold()
+        if self._owner is not None:
+            _rekey(self._owner._tasks_by_title, old_key, self._title_key, self)
+        self._invalidate()
 
     @property
     def assigned_to(self):
@@ -344,7 +575,8 @@ class Task:
 
     @assigned_to.setter
     def assigned_to(self, value: str):
-        self._assigned_to = value
+        self._assigned_to = sys.intern(value) if isinstance(value, str) else value
+        self._invalidate()
 
     @property
     def status(self):
@@ -353,22 +585,53 @@ class Task:
     @status.setter
     def status(self, value: str):
         """Validate status before setting."""
+        if isinstance(value, str):
+            value = sys.intern(value)
         if value not in Task.VALID_STATUSES:
-            raise ValueError(f"Status must be one of: {Task.VALID_STATUSES}")
+            raise ValueError(f"Status must be one of: {sorted(Task.VALID_STATUSES)}")
         self._status = value
+        self._invalidate()
+
+    def complete(self) -> bool:
+        """
+        Mark this task as complete.
 
-    def complete(self):
-        """Mark this task as complete."""
-        self._status = "complete"
+        Returns:
+            bool: True if the status changed, False if it was already complete
+                  (nothing is invalidated, so callers can skip saving).
+        """
+        if self._status is _COMPLETE:
+            return False
+        self._status = _COMPLETE
+        self._invalidate()
+        return True
+
+    def __getstate__(self):
+        """Pickle every slot except the to_dict() cache (see storage's snapshot)."""
+        return _slot_state(self)
+
+    def __setstate__(self, state):
+        """Restore a pickled task (see storage's snapshot), re-interning its strings."""
+        _restore_slots(self, state)
+        self._status = sys.intern(self._status)
+        self._assigned_to = sys.intern(self._assigned_to)
+
+    def _invalidate(self):
+        """Drop the cached to_dict() result here and up through project and user."""
+        self._dict_cache = None
+        if self._owner is not None:
+            self._owner._invalidate()
 
     def to_dict(self):
-        """Serialize Task to a dictionary for JSON storage."""
-        return {
-            "id": self._id,
-            "title": self._title,
-            "assigned_to": self._assigned_to,
-            "status": self._status
-        }
+        """Serialize Task to a dictionary for JSON storage (cached until changed)."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self._id,
+                "title": self._title,
+                "assigned_to": self._assigned_to,
+                "status": self._status
+            }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -379,13 +642,48 @@ class Task:
             status=data.get("status", "pending"),
             task_id=data["id"]
         )
-        if data["id"] >= Task._id_counter:
-            Task._id_counter = data["id"] + 1
         return task
 
+    # A task has no children, so the flat form is the same as the dict form
+    from_flat = from_dict
+
     def __str__(self):
         assignee = f" | Assigned to: {self._assigned_to}" if self._assigned_to else ""
         return f"[Task #{self._id}] {self._title} | Status: {self._status}{assignee}"
 
     def __repr__(self):
-        return f"Task(id={self._id}, title={self._title!r}, status={self._status!r})"
\ No newline at end of file
+        return f"Task(id={self._id}, title={self._title!r}, status={self._status!r})"
+
+
+# ─────────────────────────────────────────────
+# ID GENERATORS
+# ─────────────────────────────────────────────
+
+def _advance_id_gen(cls, max_id: int):
+    """Restart cls._id_gen after max_id (never moving it backwards)."""
+    cls._id_gen = itertools.count(max(max_id + 1, next(cls._id_gen)))
+
+
+def reseed_ids(users: list):
+    """
+    Keep the ID generators ahead of every ID in a loaded user tree.
+    Called once after a bulk load (see storage.load_users) so from_dict
+    doesn't have to check the counters per record.
+
+    Args:
+        users (list): Loaded User instances with their projects and tasks.
+    """
+    max_user = max_project = max_task = 0
+    for user in users:
+        if user._id > max_user:
+            max_user = user._id
+        for project in user._projects:
+            if project._id > max_project:
+                max_project = project._id
+            for task in project._tasks:
+                if task._id > max_task:
+                    max_task = task._id
+
+    _advance_id_gen(User, max_user)
+    _advance_id_gen(Project, max_project)
+    _advance_id_gen(Task, max_task)
@@ -5,23 +5,76 @@ All operations (add, list, update) go through here.
 The CLI calls these functions — services call storage for persistence.
 
 Flow:
-    CLI (cli.py) → Services (services.py) → Storage (storage.py) → data/users.json
+    CLI (cli.py) → Services (services.py) → Storage (storage.py) → data/users/
 """
 
+from functools import wraps
+
 from project_manager.models import User, Project, Task
 from project_manager import storage
 
 
+# Where users are loaded from and changes are recorded. The file-based
+# backend by default; tests and scripts can swap in another (set_backend).
+_backend: storage.StorageBackend = storage.FileBackend()
+
+
+def set_backend(backend: storage.StorageBackend) -> storage.StorageBackend:
+    """
+    Replace the storage backend the services use.
+
+    Args:
+        backend (StorageBackend): e.g. storage.InMemoryBackend(initial=[...]).
+
+    Returns:
+        StorageBackend: The previous backend, so callers can restore it.
+    """
+    global _backend, _indexed_users
+    previous, _backend = _backend, backend
+    _indexed_users = None  # the name index belonged to the old backend's list
+    return previous
 
 
 def _get_all_users() -> list:
-    """Load and return all users from storage."""
-    return storage.load_users()
+    """Load and return all users from the backend."""
+    return _backend.load_users()
+
+
+def _save_user(users: list, user: User):
+    """Mark one user (of the loaded users) as changed; storage writes only that user's file."""
+    _backend.mark_dirty(users, user)
+
+
+def flush():
+    """Write any changes the backend is still holding (see storage.flush)."""
+    _backend.flush()
+
+
+# Name index for the most recently loaded users list. Rebuilt only when
+# storage hands back a different list or a user has been renamed since
+# (User.rename_count), so repeated lookups are O(1).
+_indexed_users = None
+_indexed_renames = None
+_users_by_name = {}
+
 
+def _user_index(users: list) -> dict:
+    """
+    Return a name.casefold() → User index for the given users list.
+
+    Args:
+        users (list): List of User instances (as returned by storage).
 
-def _save_all_users(users: list):
-    """Persist all users to storage."""
-    storage.save_users(users)
+    Returns:
+        dict: Index of users keyed by case-folded name.
+    """
+    global _indexed_users, _indexed_renames, _users_by_name
+    if users is not _indexed_users or User.rename_count != _indexed_renames:
+        index = {}
+        for user in users:
+            index.setdefault(user.name_key, user)
+        _indexed_users, _indexed_renames, _users_by_name = users, User.rename_count, index
+    return _users_by_name
 
 
 def _find_user(users: list, name: str):
@@ -35,44 +88,107 @@ def _find_user(users: list, name: str):
     Returns:
         User or None: Matched user, or None if not found.
     """
-    for user in users:
-        if user.name.lower() == name.lower():
-            return user
-    return None
+    return _user_index(users).get(name.casefold())
 
 
-def _find_project(user: User, title: str):
+def _fail(message: str) -> dict:
     """
-    Find a project by title within a user's projects (case-insensitive).
+    Build the failure result for message.
 
     Args:
-        user (User): The user to search within.
-        title (str): Project title to look for.
+        message (str): The error message.
 
     Returns:
-        Project or None: Matched project, or None if not found.
+        dict: Result with 'success' (False), 'message', and empty 'data'.
     """
-    for project in user.projects:
-        if project.title.lower() == title.lower():
-            return project
-    return None
+    return {"success": False, "message": message, "data": []}
+
 
+# The names of a service's leading parameters, in the order with_context
+# resolves them: the user, then one of their projects, then one of its tasks.
+_CONTEXT_PARAMS = ("username", "project_title", "task_title")
+_CONTEXT_NEEDS = ("user", "project", "task")
 
-def _find_task(project: Project, title: str):
+
+def with_context(*needs):
     """
-    Find a task by title within a project (case-insensitive).
+    Decorator for services that act on an existing user / project / task.
+    Loads the users and resolves each object in needs from the service's
+    leading arguments (username, project_title, task_title, in that
+    order), returning the matching "not found" failure if one is missing.
+    The resolved objects are passed on as keyword arguments — users and
+    user, plus project and task when needed.
 
     Args:
-        project (Project): The project to search within.
-        title (str): Task title to look for.
+        *needs (str): A prefix of ("user", "project", "task").
 
     Returns:
-        Task or None: Matched task, or None if not found.
+        Callable: The decorator.
     """
-    for task in project.tasks:
-        if task.title.lower() == title.lower():
-            return task
-    return None
+    depth = len(needs)
+    if needs != _CONTEXT_NEEDS[:depth]:
+        raise ValueError(f"needs must be a prefix of {_CONTEXT_NEEDS}, got {needs}")
+    names = _CONTEXT_PARAMS[:depth]
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Leading arguments may come positionally or (from the CLI) by keyword
+            missing = [name for name in names[len(args):] if name not in kwargs]
+            if missing:
+                raise TypeError(f"{fn.__name__}() missing required argument: '{missing[0]}'")
+            keys = args[:depth] + tuple(kwargs[name] for name in names[len(args):])
+
+            users = _get_all_users()
+            user = _find_user(users, keys[0])
+            if user is None:
+                return _fail(f"User '{keys[0]}' not found.")
+            context = {"users": users, "user": user}
+
+            if depth > 1:
+                project = user.find_project(keys[1])
+                if project is None:
+                    return _fail(f"Project '{keys[1]}' not found for '{keys[0]}'.")
+                context["project"] = project
+
+                if depth > 2:
+                    task = project.find_task(keys[2])
+                    if task is None:
+                        return _fail(f"Task '{keys[2]}' not found in '{keys[1]}'.")
+                    context["task"] = task
+
+            return fn(*args, **kwargs, **context)
+        return wrapper
+    return decorator
+
+
+# ─────────────────────────────────────────────
+# DISPLAY ROWS
+# ─────────────────────────────────────────────
+
+# Shown in list output for optional fields that are empty
+EMPTY_CELL = "—"
+
+
+def _user_row(user: User) -> tuple:
+    """Return (id, name, email, project count) as display strings."""
+    return (str(user.id), user.name, user.email, str(len(user.projects)))
+
+
+def _project_row(project: Project) -> tuple:
+    """Return (id, title, description, due date, task count) as display strings."""
+    return (
+        str(project.id),
+        project.title,
+        project.description or EMPTY_CELL,
+        project.due_date or EMPTY_CELL,
+        str(len(project.tasks))
+    )
+
+
+def _task_row(task: Task) -> tuple:
+    """Return (id, title, assigned to, status) as display strings."""
+    return (str(task.id), task.title, task.assigned_to or EMPTY_CELL, task.status)
 
 
 # ─────────────────────────────────────────────
@@ -92,17 +208,30 @@ def add_user(name: str, email: str) -> dict:
     """
     users = _get_all_users()
 
-    # Check for duplicate name
-    if _find_user(users, name):
-        return {"success": False, "message": f"User '{name}' already exists."}
+    # Check for duplicate name (as the User will store it, stripped)
+    if name.strip().casefold() in _user_index(users):
+        return _fail(f"User '{name}' already exists.")
 
     try:
         new_user = User(name=name, email=email)
         users.append(new_user)
-        _save_all_users(users)
+        _user_index(users)[new_user.name_key] = new_user  # keep the index in sync
+        _save_user(users, new_user)
         return {"success": True, "message": f"User '{name}' created successfully."}
     except ValueError as e:
-        return {"success": False, "message": str(e)}
+        return _fail(str(e))
+
+
+def list_users_iter():
+    """
+    Yield a display row for each user (see _user_row), streaming the
+    users from storage so the full user tree never has to be in memory.
+
+    Yields:
+        tuple: One display row per user, ordered by ID.
+    """
+    for user in _backend.iter_users():
+        yield _user_row(user)
 
 
 def list_users() -> dict:
@@ -110,21 +239,23 @@ def list_users() -> dict:
     Retrieve all users.
 
     Returns:
-        dict: Result with 'success' (bool), 'message' (str), and 'data' (list of User).
+        dict: Result with 'success' (bool), 'message' (str), and 'data'
+              (list of display rows, see _user_row).
     """
-    users = _get_all_users()
+    rows = list(list_users_iter())
 
-    if not users:
-        return {"success": False, "message": "No users found.", "data": []}
+    if not rows:
+        return _fail("No users found.")
 
-    return {"success": True, "message": f"{len(users)} user(s) found.", "data": users}
+    return {"success": True, "message": f"{len(rows)} user(s) found.", "data": rows}
 
 
 # ─────────────────────────────────────────────
 # PROJECT SERVICES
 # ─────────────────────────────────────────────
 
-def add_project(username: str, title: str, description: str = "", due_date: str = "") -> dict:
+@with_context("user")
+def add_project(username: str, title: str, description: str = "", due_date: str = "", *, users, user) -> dict:
     """
     Add a project to an existing user.
 
@@ -133,56 +264,50 @@ def add_project(username: str, title: str, description: str = "", due_date: str
         title (str): Project title.
         description (str): Optional project description.
         due_date (str): Optional due date string.
+        users, user: Supplied by with_context.
 
     Returns:
         dict: Result with 'success' and 'message'.
     """
-    users = _get_all_users()
-    user = _find_user(users, username)
-
-    if not user:
-        return {"success": False, "message": f"User '{username}' not found."}
-
     # Check for duplicate project title under this user
-    if _find_project(user, title):
-        return {"success": False, "message": f"Project '{title}' already exists for '{username}'."}
+    if user.has_project(title):
+        return _fail(f"Project '{title}' already exists for '{username}'.")
 
     try:
         new_project = Project(title=title, description=description, due_date=due_date)
         user.add_project(new_project)
-        _save_all_users(users)
+        _save_user(users, user)
         return {"success": True, "message": f"Project '{title}' added to user '{username}'."}
     except ValueError as e:
-        return {"success": False, "message": str(e)}
+        return _fail(str(e))
 
 
-def list_projects(username: str) -> dict:
+@with_context("user")
+def list_projects(username: str, *, users, user) -> dict:
     """
     List all projects for a given user.
 
     Args:
         username (str): Name of the user.
+        users, user: Supplied by with_context.
 
     Returns:
-        dict: Result with 'success', 'message', and 'data' (list of Project).
+        dict: Result with 'success', 'message', and 'data' (list of display
+              rows, see _project_row).
     """
-    users = _get_all_users()
-    user = _find_user(users, username)
-
-    if not user:
-        return {"success": False, "message": f"User '{username}' not found.", "data": []}
-
     if not user.projects:
-        return {"success": False, "message": f"No projects found for '{username}'.", "data": []}
+        return _fail(f"No projects found for '{username}'.")
 
-    return {"success": True, "message": f"{len(user.projects)} project(s) found.", "data": user.projects}
+    rows = [_project_row(project) for project in user.projects]
+    return {"success": True, "message": f"{len(rows)} project(s) found.", "data": rows}
 
 
 # ─────────────────────────────────────────────
 # TASK SERVICES
 # ─────────────────────────────────────────────
 
-def add_task(username: str, project_title: str, title: str, assigned_to: str = "") -> dict:
+@with_context("user", "project")
+def add_task(username: str, project_title: str, title: str, assigned_to: str = "", *, users, user, project) -> dict:
     """
     Add a task to a project belonging to a user.
 
@@ -191,63 +316,47 @@ def add_task(username: str, project_title: str, title: str, assigned_to: str = "
         project_title (str): Title of the project.
         title (str): Task title.
         assigned_to (str): Optional name of person assigned to the task.
+        users, user, project: Supplied by with_context.
 
     Returns:
         dict: Result with 'success' and 'message'.
     """
-    users = _get_all_users()
-    user = _find_user(users, username)
-
-    if not user:
-        return {"success": False, "message": f"User '{username}' not found."}
-
-    project = _find_project(user, project_title)
-
-    if not project:
-        return {"success": False, "message": f"Project '{project_title}' not found for '{username}'."}
-
     # Check for duplicate task title within the project
-    if _find_task(project, title):
-        return {"success": False, "message": f"Task '{title}' already exists in '{project_title}'."}
+    if project.has_task(title):
+        return _fail(f"Task '{title}' already exists in '{project_title}'.")
 
     try:
         new_task = Task(title=title, assigned_to=assigned_to)
         project.add_task(new_task)
-        _save_all_users(users)
+        _save_user(users, user)
         return {"success": True, "message": f"Task '{title}' added to project '{project_title}'."}
     except ValueError as e:
-        return {"success": False, "message": str(e)}
+        return _fail(str(e))
 
 
-def list_tasks(username: str, project_title: str) -> dict:
+@with_context("user", "project")
+def list_tasks(username: str, project_title: str, *, users, user, project) -> dict:
     """
     List all tasks for a given project.
 
     Args:
         username (str): Name of the user who owns the project.
         project_title (str): Title of the project.
+        users, user, project: Supplied by with_context.
 
     Returns:
-        dict: Result with 'success', 'message', and 'data' (list of Task).
+        dict: Result with 'success', 'message', and 'data' (list of display
+              rows, see _task_row).
     """
-    users = _get_all_users()
-    user = _find_user(users, username)
-
-    if not user:
-        return {"success": False, "message": f"User '{username}' not found.", "data": []}
-
-    project = _find_project(user, project_title)
-
-    if not project:
-        return {"success": False, "message": f"Project '{project_title}' not found.", "data": []}
-
     if not project.tasks:
-        return {"success": False, "message": f"No tasks found in '{project_title}'.", "data": []}
+        return _fail(f"No tasks found in '{project_title}'.")
 
-    return {"success": True, "message": f"{len(project.tasks)} task(s) found.", "data": project.tasks}
+    rows = [_task_row(task) for task in project.tasks]
+    return {"success": True, "message": f"{len(rows)} task(s) found.", "data": rows}
 
 
-def complete_task(username: str, project_title: str, task_title: str) -> dict:
+@with_context("user", "project", "task")
+def complete_task(username: str, project_title: str, task_title: str, *, users, user, project, task) -> dict:
     """
     Mark a task as complete.
 
@@ -255,29 +364,13 @@ def complete_task(username: str, project_title: str, task_title: str) -> dict:
         username (str): Name of the user who owns the project.
         project_title (str): Title of the project.
         task_title (str): Title of the task to mark complete.
+        users, user, project, task: Supplied by with_context.
 
     Returns:
         dict: Result with 'success' and 'message'.
     """
-    users = _get_all_users()
-    user = _find_user(users, username)
-
-    if not user:
-        return {"success": False, "message": f"User '{username}' not found."}
-
-    project = _find_project(user, project_title)
-
-    if not project:
-        return {"success": False, "message": f"Project '{project_title}' not found."}
-
-    task = _find_task(project, task_title)
-
-    if not task:
-        return {"success": False, "message": f"Task '{task_title}' not found in '{project_title}'."}
-
-    if task.status == "complete":
-        return {"success": False, "message": f"Task '{task_title}' is already complete."}
+    if not task.complete():  # already complete — nothing changed, nothing to save
+        return _fail(f"Task '{task_title}' is already complete.")
 
-    task.complete()
-    _save_all_users(users)
-    return {"success": True, "message": f"Task '{task_title}' marked as complete."}
\ No newline at end of file
+    _save_user(users, user)
+    return {"success": True, "message": f"Task '{task_title}' marked as complete."}
@@ -4,11 +4,36 @@ Handles all file I/O operations for the project manager.
 Reads and writes data to JSON files in the data/ directory.
 
 Files:
-    - data/users.json    → stores all user data (including nested projects and tasks)
+    - data/users/<id>.json → one file per user (including nested projects and tasks)
+    - data/users.json      → legacy single-file store, read once if data/users/ is empty
+    - data/users.pickle    → snapshot of the loaded users, a fast-start cache
+                             that is only used while it matches data/users/;
+                             written at exit by runs that changed nothing
+
+Saves are deferred: services call mark_dirty() for the user they changed,
+and flush() rewrites only those users' files — after FLUSH_EVERY changes,
+once the oldest pending change is FLUSH_INTERVAL seconds old (checked on
+the next mark_dirty), or at interpreter exit (registered the first time
+anything is marked dirty). The shell flushes after every command.
+
+Another process may write the folder in between: flush() never overwrites
+a user file that changed since it was loaded, and creates new users' files
+exclusively, moving a new user to a fresh ID if theirs was taken meanwhile.
 """
 
+import atexit
 import json
 import os
+import pickle
+import time
+from typing import Iterator, Protocol
+
+from project_manager.models import User, Project, Task, reseed_ids
+
+try:
+    import orjson  # optional — much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
 
 # ─────────────────────────────────────────────
 # FILE PATH CONFIGURATION
@@ -18,75 +43,534 @@ import os
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
-USERS_FILE = os.path.join(DATA_DIR, "users.json")
+USERS_DIR = os.path.join(DATA_DIR, "users")
+USERS_FILE = os.path.join(DATA_DIR, "users.json")  # legacy single-file store
+SNAPSHOT_FILE = os.path.join(DATA_DIR, "users.pickle")
+
+# Create the folders once, at import, rather than on every load and save
+os.makedirs(USERS_DIR, exist_ok=True)
+
+# In-memory copy of the last users list loaded or saved, plus the stamp
+# of the users folder it corresponds to. load_users() returns it while
+# nothing in the folder has changed.
+_cache = None
+_cache_stamp = None
+
+# The mtime (ns) of each user's file, by user ID, as of the cached list
+# (and updated as flush() writes them). flush() won't overwrite a file
+# whose mtime has moved on — another process wrote it since.
+_file_mtimes = {}
+
+# Deferred-save state: users with unsaved changes (by ID), how many
+# changes are pending, and when the oldest one was made.
+_dirty = {}
+_dirty_count = 0
+_dirty_since = None
+_flush_registered = False  # whether flush() is registered to run at exit
+
+# Stamp of the last cold JSON load, whose users are snapshotted at exit
+# unless anything is marked dirty first — a run that changes data would
+# only snapshot a tree its own writes are about to make stale.
+_snapshot_due = None
+_snapshot_registered = False  # whether _write_due_snapshot() is registered
+
+FLUSH_EVERY = 50       # flush after this many pending changes...
+FLUSH_INTERVAL = 5.0   # ...or once the oldest pending change is this old (seconds)
 
 
-def _ensure_data_dir():
+def _user_path(user_id: int) -> str:
+    """Return the path of the file that stores the user with this ID."""
+    return os.path.join(USERS_DIR, f"{user_id}.json")
+
+
+def _scan():
     """
-    Ensure the data/ directory exists.
-    Creates it if it doesn't already exist.
+    Scan the users folder once.
+
+    Returns:
+        tuple: (stamp, mtimes). stamp is the newest mtime (ns) of the
+               folder itself and the files in it, or None if it doesn't
+               exist — adding, replacing or deleting a file, or editing
+               one in place, all change it. mtimes maps the ID of each
+               <id>.json file to its mtime.
     """
-    os.makedirs(DATA_DIR, exist_ok=True)
+    mtimes = {}
+    try:
+        newest = os.stat(USERS_DIR).st_mtime_ns
+        with os.scandir(USERS_DIR) as entries:
+            for entry in entries:
+                mtime = entry.stat().st_mtime_ns
+                if mtime > newest:
+                    newest = mtime
+                stem, ext = os.path.splitext(entry.name)
+                if ext == ".json" and stem.isdigit():
+                    mtimes[int(stem)] = mtime
+    except FileNotFoundError:
+        return None, {}
+    return newest, mtimes
+
+
+def _data_stamp():
+    """Return a fingerprint of the users folder (see _scan)."""
+    return _scan()[0]
+
+
+def _set_cache(users, stamp=None, mtimes=None):
+    """
+    Remember users as the current contents of the users folder, as of
+    stamp, with mtimes the mtimes of their files. When loading, both must
+    be taken before the files are read: a change another process makes
+    while they are being read then shows up as a newer stamp instead of
+    being hidden by the cache.
+    """
+    global _cache, _cache_stamp, _file_mtimes
+    _cache = users
+    _cache_stamp = stamp
+    _file_mtimes = dict(mtimes) if mtimes else {}
+
+
+def _dumps(data) -> bytes:
+    """Encode data as compact UTF-8 JSON, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _build_model(data: dict):
+    """
+    json object_hook: turn each decoded object into its model as soon as
+    it is parsed. Objects arrive innermost first, so a project's tasks
+    (and a user's projects) are already built by the time it is seen.
+    Objects are classified by structure, matching what from_dict treats
+    as a user or project; anything else is a task, whose other fields are
+    all optional.
+    """
+    if "email" in data or "projects" in data:
+        return User.from_flat(data)
+    if "tasks" in data or "description" in data or "due_date" in data:
+        return Project.from_flat(data)
+    return Task.from_flat(data)
+
+
+def _loads_users(raw: bytes):
+    """
+    Decode JSON bytes holding one user (or a list of users, for the
+    legacy file) straight into User objects.
+    """
+    if orjson is not None:
+        # orjson has no object_hook, but its parse is fast enough that
+        # building from the decoded dicts still wins
+        data = orjson.loads(raw)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        if isinstance(data, list):
+            return [User.from_dict(u) for u in data]
+        return User.from_dict(data)
+    return json.loads(raw, object_hook=_build_model)  # one pass: parse and build
+
+
+# ─────────────────────────────────────────────
+# SNAPSHOT
+# ─────────────────────────────────────────────
+
+def _write_snapshot(users: list, stamp):
+    """
+    Pickle users, tagged with stamp, so the next run can restore the
+    whole tree without parsing JSON or calling from_dict. stamp must be
+    the one taken before the users were read, so the snapshot can never
+    claim to cover a change it doesn't contain.
+    Only written after a full JSON load, at exit, by a run that changed
+    nothing (see _write_due_snapshot) — saves rewrite just the changed
+    users' files and leave the snapshot to go stale. The JSON files stay
+    the source of truth; a snapshot that can't be written is simply left
+    stale too (its stamp no longer matches).
+    """
+    tmp_path = SNAPSHOT_FILE + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((stamp, users), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, SNAPSHOT_FILE)
+    except Exception:
+        pass
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_snapshot(stamp):
+    """Return the snapshotted users if the snapshot matches stamp, else None."""
+    try:
+        with open(SNAPSHOT_FILE, "rb") as f:
+            snap_stamp, users = pickle.load(f)
+    except Exception:  # missing, truncated, or from an incompatible version
+        return None
+    return users if snap_stamp == stamp else None
+
+
+def _snapshot_at_exit(stamp):
+    """Arrange for the users just loaded (as of stamp) to be snapshotted at exit."""
+    global _snapshot_due, _snapshot_registered
+    if not _snapshot_registered:
+        atexit.register(_write_due_snapshot)
+        _snapshot_registered = True
+    _snapshot_due = stamp
+
+
+def _write_due_snapshot():
+    """
+    Snapshot the users from the last cold load, if nothing has been
+    marked dirty since and the cache still holds exactly that load.
+    Registered to run at exit by _snapshot_at_exit().
+    """
+    global _snapshot_due
+    stamp, _snapshot_due = _snapshot_due, None
+    if stamp is not None and _cache is not None and not _dirty and _cache_stamp == stamp:
+        _write_snapshot(_cache, stamp)
+
+
+def _load_snapshot(stamp, mtimes):
+    """Restore and cache the users from a snapshot matching stamp, or return None."""
+    users = _read_snapshot(stamp)
+    if users is not None:
+        reseed_ids(users)  # class-level ID generators aren't part of the pickle
+        _set_cache(users, stamp, mtimes)
+    return users
 
 
 # ─────────────────────────────────────────────
 # SAVE
 # ─────────────────────────────────────────────
 
-def save_users(users: list):
+def _write_user(user):
+    """
+    Write one user's file atomically: the data goes to a temporary file
+    that is then renamed over the real one, so a crash mid-write can't
+    leave a truncated file.
+    """
+    path = _user_path(user.id)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(user.to_dict()))  # compact JSON — no indentation to write or parse
+        os.replace(tmp_path, path)  # atomic swap
+        _file_mtimes[user.id] = os.stat(path).st_mtime_ns
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _claim_file(user) -> bool:
     """
-    Serialize and save a list of User objects to users.json.
+    Check that flush() may write user's file without clobbering another
+    process's work. A file loaded (or last written) by this process may
+    be rewritten only while its mtime is still the one recorded then. A
+    new user's file is created exclusively (O_EXCL); if another process
+    already took that ID, the user is moved to the next free one.
 
     Args:
-        users (list): List of User instances to persist.
+        user (User): The user about to be written.
+
+    Returns:
+        bool: False if the user's file was changed or removed by
+              another process since this one loaded it.
     """
-    _ensure_data_dir()
+    known = _file_mtimes.get(user.id)
+    if known is not None:
+        try:
+            return os.stat(_user_path(user.id)).st_mtime_ns == known
+        except FileNotFoundError:
+            return False
 
-    try:
-        data = [user.to_dict() for user in users]  # serialize each user
+    while True:
+        try:
+            fd = os.open(_user_path(user.id), os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+        except FileExistsError:
+            user.reassign_id()
+            continue
+        os.close(fd)
+        _file_mtimes[user.id] = os.stat(_user_path(user.id)).st_mtime_ns  # ours now
+        return True
 
-        with open(USERS_FILE, "w") as f:
-            json.dump(data, f, indent=4)  # write pretty-printed JSON
+
+def _save(users: list, cache):
+    """Write each user's file, then make cache the in-memory copy of the folder."""
+    try:
+        for user in users:
+            _write_user(user)
+        _set_cache(cache, *_scan())  # includes the files just written
 
     except IOError as e:
+        _set_cache(None)  # in-memory objects no longer match the files
         print(f"[ERROR] Could not save data: {e}")
     except Exception as e:
+        _set_cache(None)
         print(f"[ERROR] Unexpected error while saving: {e}")
 
 
+def save_user(user):
+    """
+    Serialize and save a single User to data/users/<id>.json.
+    Only this user's file is rewritten; other users are untouched.
+
+    Args:
+        user (User): The user to persist.
+    """
+    # The cached list stays valid only if it already holds this user
+    in_cache = _cache is not None and any(u is user for u in _cache)
+    _save([user], _cache if in_cache else None)
+
+
+def save_users(users: list):
+    """
+    Serialize and save each User in the list to its own file.
+
+    Args:
+        users (list): List of User instances to persist.
+    """
+    _save(users, users)  # the saved list becomes the cache for later loads
+
+
+def mark_dirty(users: list, user):
+    """
+    Record that user (one of users) has unsaved changes.
+    Several changes are coalesced into one write per changed user; the
+    write happens here only once FLUSH_EVERY changes are pending or the
+    oldest is FLUSH_INTERVAL seconds old. Otherwise call flush(); it
+    also runs at interpreter exit, so library callers that never call
+    it still get their changes written.
+
+    Args:
+        users (list): The full list of User instances the user belongs to.
+        user (User): The user that was changed.
+    """
+    global _cache, _dirty_count, _dirty_since, _flush_registered, _snapshot_due
+    if not _flush_registered:
+        atexit.register(flush)
+        _flush_registered = True
+
+    _snapshot_due = None  # this run changes data; leave the snapshot alone
+    _cache = users  # pending changes live in this list until flushed
+    _dirty[user.id] = user
+    _dirty_count += 1
+    if _dirty_since is None:
+        _dirty_since = time.monotonic()
+
+    if _dirty_count >= FLUSH_EVERY or time.monotonic() - _dirty_since >= FLUSH_INTERVAL:
+        flush()
+
+
+def flush():
+    """
+    Write the files of users with pending changes. Does nothing if nothing changed.
+    A user stays pending until their file has actually been written, so
+    a failed write is reported and retried by the next flush rather than
+    silently dropped. A user whose file another process changed since it
+    was loaded is not overwritten; that is reported, and the change dropped.
+    """
+    global _dirty_count, _dirty_since
+    if not _dirty:
+        return
+
+    for user_id, user in list(_dirty.items()):
+        try:
+            if not _claim_file(user):
+                print(f"[ERROR] Changes to user #{user_id} were not saved: "
+                      f"their file was changed by another process.")
+                del _dirty[user_id]
+                continue
+            if user.id != user_id:  # moved to a free ID by _claim_file
+                del _dirty[user_id]
+                user_id = user.id
+                _dirty[user_id] = user
+            _write_user(user)
+        except Exception as e:
+            print(f"[ERROR] Could not save user #{user_id}: {e}")
+            continue
+        del _dirty[user_id]
+
+    if _dirty:
+        _dirty_count = len(_dirty)
+        _dirty_since = time.monotonic()  # retry after another FLUSH_INTERVAL
+        return
+
+    _dirty_count, _dirty_since = 0, None
+    stamp, mtimes = _scan()
+    if mtimes == _file_mtimes:
+        _set_cache(_cache, stamp, mtimes)  # the files now match the in-memory list
+    else:
+        _set_cache(None)  # another process changed the folder; reload it next time
+
+
 # ─────────────────────────────────────────────
 # LOAD
 # ─────────────────────────────────────────────
 
+def _read_users(path: str):
+    """Read one JSON file into User objects; report problems and return None on failure."""
+    name = os.path.basename(path)
+    try:
+        with open(path, "rb") as f:
+            return _loads_users(f.read())
+    except json.JSONDecodeError:
+        print(f"[ERROR] {name} is corrupted or malformed. Skipping it.")
+    except KeyError as e:
+        print(f"[ERROR] Missing expected field in {name}: {e}")
+    except Exception as e:
+        print(f"[ERROR] Unexpected error while loading {name}: {e}")
+    return None
+
+
+def _load_legacy() -> list:
+    """
+    Load users from the old single-file data/users.json, if it has any.
+    They are marked dirty so the next flush writes them to data/users/.
+    """
+    if not os.path.exists(USERS_FILE) or os.path.getsize(USERS_FILE) == 0:
+        return []
+
+    users = _read_users(USERS_FILE)
+    if users is None:
+        return []
+
+    for user in users:
+        _dirty[user.id] = user
+    return users
+
+
 def load_users() -> list:
     """
-    Load and deserialize all users from users.json.
+    Load and deserialize all users from data/users/.
+    Returns the cached list (the same live objects) while nothing in the
+    folder has changed since the last load or save, and always while
+    there are unsaved changes.
 
     Returns:
-        list: List of User instances. Returns empty list if file
-              doesn't exist or is malformed.
+        list: List of User instances, ordered by ID. Files that are
+              malformed are reported and skipped.
     """
-    
-    from project_manager.models import User
+    if _dirty:
+        return _cache  # unsaved changes win over what's on disk
 
-    _ensure_data_dir()
+    stamp, mtimes = _scan()
+    if _cache is not None and stamp == _cache_stamp:
+        return _cache
 
-    # If the file doesn't exist yet, return an empty list
-    if not os.path.exists(USERS_FILE):
-        return []
+    users = _load_snapshot(stamp, mtimes)
+    if users is not None:
+        return users
 
+    users = []
     try:
-        with open(USERS_FILE, "r") as f:
-            data = json.load(f)  
+        for user_id in sorted(mtimes):
+            user = _read_users(_user_path(user_id))
+            if user is not None:
+                users.append(user)
 
-        return [User.from_dict(u) for u in data]  # rebuild User objects
+        if not mtimes:
+            users = _load_legacy()
 
-    except json.JSONDecodeError:
-        print("[ERROR] users.json is corrupted or malformed. Starting fresh.")
-        return []
-    except KeyError as e:
-        print(f"[ERROR] Missing expected field in users.json: {e}")
-        return []
     except Exception as e:
         print(f"[ERROR] Unexpected error while loading: {e}")
-        return []
\ No newline at end of file
+        return []
+
+    reseed_ids(users)  # keep new IDs ahead of the loaded ones
+    _set_cache(users, stamp, mtimes)  # the scan from before the files were read
+    if users and not _dirty:
+        _snapshot_at_exit(stamp)  # so the next run can skip the JSON
+    return users
+
+
+def iter_users():
+    """
+    Yield all users one at a time, ordered by ID.
+    When the cache is current (or holds unsaved changes) its users are
+    yielded, and an up-to-date snapshot is restored (and cached) as
+    load_users() would. Otherwise each user file is read only as it is
+    reached, so at most one user tree is held in memory. Streamed users
+    are not cached — use load_users() when the users will be changed.
+
+    Yields:
+        User: Each user in turn. Malformed files are reported and skipped.
+    """
+    stamp, mtimes = _scan()
+    if _dirty or (_cache is not None and stamp == _cache_stamp):
+        yield from _cache
+        return
+
+    users = _load_snapshot(stamp, mtimes)
+    if users is not None:
+        yield from users  # one unpickle beats parsing every file
+        return
+
+    if not mtimes:
+        yield from load_users()  # legacy single-file store, or no users at all
+        return
+
+    for user_id in sorted(mtimes):
+        user = _read_users(_user_path(user_id))
+        if user is not None:
+            yield user
+
+
+# ─────────────────────────────────────────────
+# BACKENDS
+# ─────────────────────────────────────────────
+
+class StorageBackend(Protocol):
+    """The storage operations the services layer relies on (see services.set_backend)."""
+
+    def load_users(self) -> list:
+        """Return the live list of all users."""
+        ...
+
+    def iter_users(self) -> Iterator[User]:
+        """Yield all users one at a time (read-only use)."""
+        ...
+
+    def mark_dirty(self, users: list, user: User) -> None:
+        """Record that user, one of the loaded users, has changed."""
+        ...
+
+    def flush(self) -> None:
+        """Write any changes still pending."""
+        ...
+
+
+class FileBackend:
+    """The default backend: the per-user JSON files in data/users/."""
+
+    def load_users(self) -> list:
+        return load_users()
+
+    def iter_users(self) -> Iterator[User]:
+        return iter_users()
+
+    def mark_dirty(self, users: list, user: User) -> None:
+        mark_dirty(users, user)
+
+    def flush(self) -> None:
+        flush()
+
+
+class InMemoryBackend:
+    """
+    A backend that keeps users in a list and never touches the disk.
+    Handy for tests and for scripting against the services.
+
+    Args:
+        initial (iterable, optional): Users to start with.
+    """
+
+    def __init__(self, initial=()):
+        self.users = list(initial)
+        self.changed = []  # users passed to mark_dirty, in order
+
+    def load_users(self) -> list:
+        return self.users
+
+    def iter_users(self) -> Iterator[User]:
+        return iter(self.users)
+
+    def mark_dirty(self, users: list, user: User) -> None:
+        self.changed.append(user)
+
+    def flush(self) -> None:
+        pass  # nothing is ever pending
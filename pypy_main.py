@@ -0,0 +1,23 @@
+"""
+pypy_main.py
+PyPy entry point for the Project Manager CLI tool.
+Identical to main.py, but intended to be run with PyPy for scripted or
+bulk use.
+
+PyPy's JIT only pays off once code has run many times, so one-shot
+commands are usually faster on CPython. Pair this entry point with the
+long-lived `shell` command so a whole batch runs in one warm process.
+
+Usage:
+    pypy3 pypy_main.py shell < commands.txt
+
+Example commands.txt:
+    add-user --name "Alex" --email "alex@email.com"
+    add-project --user "Alex" --title "CLI Tool"
+    add-task --user "Alex" --project "CLI Tool" --title "Implement storage"
+"""
+
+from project_manager.cli import main
+
+if __name__ == "__main__":
+    main()
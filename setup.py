@@ -0,0 +1,25 @@
+"""
+setup.py
+Optional Cython build for the model layer.
+
+Package metadata lives in pyproject.toml; this file only adds a compiled
+copy of project_manager/models.py when Cython is installed. The module
+is compiled as-is (pure-Python mode), so the class definitions, slots
+and properties behave exactly like the .py source. Without Cython, or
+if the .so is missing, Python imports models.py as usual.
+
+Build in place with:
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []  # Cython not installed — ship the pure-Python models
+else:
+    ext_modules = cythonize(["project_manager/models.py"], language_level=3)
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,33 @@
+"""
+tests/conftest.py
+Fixtures shared by more than one test module.
+"""
+
+import pytest
+import sys
+import os
+
+# Make sure the root folder is on the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ─────────────────────────────────────────────
+# FIXTURES — shared across test modules
+# ─────────────────────────────────────────────
+
+@pytest.fixture
+def use_backend():
+    """
+    Return a function that installs an InMemoryBackend holding the given
+    users for the services; the previous backend is restored afterwards.
+    """
+    from project_manager import services, storage
+
+    def install(*users):
+        backend = storage.InMemoryBackend(initial=users)
+        services.set_backend(backend)
+        return backend
+
+    previous = services._backend
+    yield install
+    services.set_backend(previous)
@@ -0,0 +1,142 @@
+"""
+tests/test_cli.py
+Unit tests for the command-line layer.
+Tests cover:
+    - Subcommand sniffing and partial parser construction
+    - Plain-text table output
+    - The stdin-driven shell command
+
+Run with:
+    pytest tests/test_cli.py -v
+"""
+
+import io
+import sys
+import os
+
+# Make sure the root folder is on the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_manager import cli
+from project_manager.models import User, Project
+
+
+# ─────────────────────────────────────────────
+# PARSER TESTS
+# ─────────────────────────────────────────────
+
+class TestParser:
+    """Tests for subcommand sniffing and parser construction."""
+
+    def test_sniff_known_command(self):
+        """The first token should be returned when it is a known command."""
+        assert cli._sniff_subcommand(["add-user", "--name", "Alex"]) == "add-user"
+
+    def test_sniff_unknown_or_missing_command(self):
+        """Unknown commands, options, and empty argv should not be sniffed."""
+        assert cli._sniff_subcommand(["bogus"]) is None
+        assert cli._sniff_subcommand(["--help"]) is None
+        assert cli._sniff_subcommand([]) is None
+
+    def test_build_parser_only_registers_one_command(self):
+        """build_parser(only=...) should parse just the requested command."""
+        parser = cli.build_parser(only="list-tasks")
+        args = parser.parse_args(["list-tasks", "--user", "Alex", "--project", "CLI Tool"])
+        assert args.command == "list-tasks"
+        assert args.plain is False
+
+
+# ─────────────────────────────────────────────
+# PLAIN OUTPUT TESTS
+# ─────────────────────────────────────────────
+
+class TestPlainOutput:
+    """Tests for the plain-text (non-rich) list output."""
+
+    def test_write_plain_aligns_columns(self, capsys):
+        """Columns should be padded to their widest cell."""
+        cli.write_plain(("ID", "Name"), [("1", "Alex"), ("10", "Jordan")])
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == ["ID  Name", "1   Alex", "10  Jordan"]
+
+    def test_list_projects_plain(self, use_backend, capsys):
+        """list-projects --plain should print rows without a rich table."""
+        user = User(name="Alex", email="alex@email.com")
+        user.add_project(Project(title="CLI Tool", due_date="2025-12-31"))
+        use_backend(user)
+
+        args = cli.build_parser().parse_args(["list-projects", "--user", "Alex", "--plain"])
+        cli._COMMANDS[args.command](args)
+
+        out = capsys.readouterr().out
+        assert "CLI Tool" in out
+        assert "2025-12-31" in out
+        assert "╭" not in out
+
+
+# ─────────────────────────────────────────────
+# SHELL TESTS
+# ─────────────────────────────────────────────
+
+def run_shell(monkeypatch, script: str):
+    """Run the shell command with script as its stdin."""
+    monkeypatch.setattr(sys, "stdin", io.StringIO(script))
+    args = cli.build_parser().parse_args(["shell"])
+    cli._COMMANDS[args.command](args)
+
+
+class TestShell:
+    """Tests for the shell command (one command per stdin line)."""
+
+    def test_dispatches_commands(self, use_backend, monkeypatch):
+        """Each line should run through the same handlers as the CLI."""
+        backend = use_backend()
+        run_shell(monkeypatch, "add-user --name Alex --email alex@email.com\n"
+                               "add-project --user Alex --title 'CLI Tool'\n")
+
+        assert [u.name for u in backend.users] == ["Alex"]
+        assert backend.users[0].find_project("cli tool") is not None
+
+    def test_skips_comments_and_blank_lines(self, use_backend, monkeypatch, capsys):
+        """Blank lines and '#' comments should be ignored without errors."""
+        backend = use_backend()
+        run_shell(monkeypatch, "\n# a comment\n   \nadd-user --name Alex --email alex@email.com\n")
+
+        assert [u.name for u in backend.users] == ["Alex"]
+        assert "✘" not in capsys.readouterr().out
+
+    def test_parse_error_does_not_end_session(self, use_backend, monkeypatch, capsys):
+        """A bad line should be reported and the following lines still run."""
+        backend = use_backend()
+        run_shell(monkeypatch, "add-user --name\n"
+                               "add-user --name 'Unclosed\n"
+                               "add-user --name Alex --email alex@email.com\n")
+
+        assert "Could not parse command" in capsys.readouterr().out
+        assert [u.name for u in backend.users] == ["Alex"]
+
+    def test_exit_stops_the_loop(self, use_backend, monkeypatch):
+        """Nothing after 'exit' should run."""
+        backend = use_backend()
+        run_shell(monkeypatch, "exit\nadd-user --name Alex --email alex@email.com\n")
+
+        assert backend.users == []
+
+    def test_flushes_after_each_command(self, use_backend, monkeypatch):
+        """Each command's changes should be written before the next line is read."""
+        from project_manager import services
+
+        use_backend()
+        flushes = []
+        monkeypatch.setattr(services, "flush", lambda: flushes.append(True))
+        run_shell(monkeypatch, "add-user --name Alex --email alex@email.com\n"
+                               "list-users\n")
+
+        assert len(flushes) == 2
+
+    def test_nested_shell_is_rejected(self, use_backend, monkeypatch, capsys):
+        """Running 'shell' inside the shell should be refused."""
+        use_backend()
+        run_shell(monkeypatch, "shell\n")
+
+        assert "Already in the shell." in capsys.readouterr().out
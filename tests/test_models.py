@@ -19,7 +19,7 @@ import os
 # Make sure the root folder is on the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from project_manager.models import User, Project, Task
+from project_manager.models import User, Project, Task, reseed_ids
 
 
 # ─────────────────────────────────────────────
@@ -82,6 +82,12 @@ class TestUser:
         user.name = "  Jordan  "
         assert user.name == "Jordan"
 
+    def test_user_name_key_follows_name(self, sample_user):
+        """name_key should be the case-folded name, updated by the setter."""
+        assert sample_user.name_key == "alex"
+        sample_user.name = "STRASSE"
+        assert sample_user.name_key == "strasse"
+
     def test_user_name_cannot_be_empty(self, sample_user):
         """Setting an empty name should raise ValueError."""
         with pytest.raises(ValueError):
@@ -97,6 +103,27 @@ class TestUser:
         with pytest.raises(ValueError):
             sample_user.email = "not-an-email"
 
+    def test_user_email_requires_domain(self, sample_user):
+        """Emails without a dotted domain or with spaces should be rejected."""
+        for bad in ("alex@", "alex@email", "al ex@email.com", "@email.com"):
+            with pytest.raises(ValueError):
+                sample_user.email = bad
+
+    def test_user_email_setter_strips_whitespace(self, sample_user):
+        """Email setter should strip surrounding whitespace before validating."""
+        sample_user.email = "  alex@new.com  "
+        assert sample_user.email == "alex@new.com"
+
+    def test_new_user_email_is_validated(self):
+        """Creating a user with a malformed email should raise ValueError."""
+        with pytest.raises(ValueError):
+            User(name="B", email="nope")
+
+    def test_loaded_user_keeps_stored_email(self):
+        """Users loaded from file should not be rejected by the newer validation."""
+        user = User.from_dict({"id": 1, "name": "B", "email": "nope"})
+        assert user.email == "nope"
+
     def test_user_valid_email_update(self, sample_user):
         """Valid email update should work correctly."""
         sample_user.email = "newemail@test.com"
@@ -183,9 +210,25 @@ class TestTask:
 
     def test_task_complete_method(self, sample_task):
         """Calling complete() should set status to 'complete'."""
-        sample_task.complete()
+        assert sample_task.complete() is True
         assert sample_task.status == "complete"
 
+    def test_task_complete_twice_reports_no_change(self, sample_task):
+        """complete() on a completed task should return False."""
+        sample_task.complete()
+        assert sample_task.complete() is False
+
+    def test_task_status_is_interned(self, sample_task):
+        """Statuses from the setter and from a pickle should be the interned strings."""
+        import pickle
+
+        sample_task.status = "".join(["com", "plete"])
+        assert sample_task.status is sys.intern("complete")
+
+        restored = pickle.loads(pickle.dumps(sample_task, protocol=pickle.HIGHEST_PROTOCOL))
+        assert restored.status is sys.intern("complete")
+        assert restored.complete() is False
+
     def test_task_invalid_status(self, sample_task):
         """Setting an invalid status should raise ValueError."""
         with pytest.raises(ValueError):
@@ -250,12 +293,40 @@ class TestRelationships:
         with pytest.raises(TypeError):
             sample_project.add_task(42)
 
+    def test_find_project_case_insensitive(self, sample_user, sample_project):
+        """find_project should match titles regardless of case."""
+        sample_user.add_project(sample_project)
+        assert sample_user.find_project("cli tool") is sample_project
+        assert sample_user.find_project("Missing") is None
+
+    def test_renamed_task_is_reindexed(self, sample_project, sample_task):
+        """Renaming a task should update its project's title index."""
+        sample_project.add_task(sample_task)
+        sample_task.title = "Write more tests"
+        assert sample_project.find_task("write more tests") is sample_task
+        assert sample_project.find_task("Write tests") is None
+
+    def test_has_project_and_has_task(self, user_with_project_and_task):
+        """has_project/has_task should be case-insensitive existence checks."""
+        user, project, task = user_with_project_and_task
+        assert user.has_project("FULL STACK APP")
+        assert not user.has_project("Other")
+        assert project.has_task("setup DATABASE")
+        assert not project.has_task("Other")
+
     def test_full_chain(self, user_with_project_and_task):
         """Full chain User → Project → Task should be accessible."""
         user, project, task = user_with_project_and_task
         assert user.projects[0].title == "Full Stack App"
         assert user.projects[0].tasks[0].title == "Setup database"
 
+    def test_models_have_no_instance_dict(self, user_with_project_and_task):
+        """Every model (and the Person base) should use __slots__, not a __dict__."""
+        for obj in user_with_project_and_task:
+            assert not hasattr(obj, "__dict__")
+            with pytest.raises(AttributeError):
+                obj.unexpected = 1
+
 
 # ─────────────────────────────────────────────
 # SERIALIZATION TESTS
@@ -349,6 +420,39 @@ class TestSerialization:
         assert restored.projects[0].title == sample_project.title
         assert restored.projects[0].tasks[0].title == sample_task.title
 
+    def test_to_dict_cache_invalidated_by_nested_change(self, user_with_project_and_task):
+        """Changing a task should refresh the cached dicts of its project and user."""
+        user, project, task = user_with_project_and_task
+        other = Project(title="Untouched")
+        user.add_project(other)
+
+        before = user.to_dict()
+        untouched_before = other.to_dict()
+        task.complete()
+        after = user.to_dict()
+
+        assert before["projects"][0]["tasks"][0]["status"] == "pending"
+        assert after["projects"][0]["tasks"][0]["status"] == "complete"
+        assert other.to_dict() is untouched_before  # sibling subtree reused
+
+    def test_reseed_ids_after_load(self):
+        """New objects created after a bulk load should not reuse loaded IDs."""
+        data = {
+            "id": 5000,
+            "name": "Loaded User",
+            "email": "loaded@email.com",
+            "projects": [
+                {"id": 6000, "title": "Loaded Project", "tasks": [
+                    {"id": 7000, "title": "Loaded Task"}
+                ]}
+            ]
+        }
+        reseed_ids([User.from_dict(data)])
+
+        assert User(name="New", email="new@email.com").id > 5000
+        assert Project(title="New Project").id > 6000
+        assert Task(title="New Task").id > 7000
+
 
 # ─────────────────────────────────────────────
 # SERVICES TESTS
@@ -357,55 +461,140 @@ class TestSerialization:
 class TestServices:
     """
     Tests for the services layer.
-    Uses monkeypatching to avoid reading/writing real JSON files.
+    Uses an in-memory storage backend, so no JSON files are read or written.
     """
 
-    def test_add_user_success(self, monkeypatch):
+    def test_add_user_success(self, use_backend):
         """add_user should return success when user doesn't exist."""
         from project_manager import services
 
-        monkeypatch.setattr(services.storage, "load_users", lambda: [])
-        monkeypatch.setattr(services.storage, "save_users", lambda users: None)
+        use_backend()
 
         result = services.add_user("TestUser", "test@email.com")
         assert result["success"] is True
         assert "TestUser" in result["message"]
 
-    def test_add_user_duplicate(self, monkeypatch):
+    def test_add_user_duplicate(self, use_backend):
         """add_user should fail if user already exists."""
         from project_manager import services
 
         existing = User(name="TestUser", email="test@email.com")
-        monkeypatch.setattr(services.storage, "load_users", lambda: [existing])
-        monkeypatch.setattr(services.storage, "save_users", lambda users: None)
+        use_backend(existing)
 
         result = services.add_user("TestUser", "other@email.com")
         assert result["success"] is False
         assert "already exists" in result["message"]
 
-    def test_add_project_success(self, monkeypatch):
+    def test_add_user_rejects_malformed_email(self, use_backend):
+        """add_user should fail, and save nothing, for a malformed email."""
+        from project_manager import services
+
+        backend = use_backend()
+
+        result = services.add_user(name="B", email="nope")
+        assert result["success"] is False
+        assert "Invalid email" in result["message"]
+        assert backend.users == [] and backend.changed == []
+
+    def test_add_user_duplicate_ignores_surrounding_spaces(self, use_backend):
+        """' Alex ' should clash with an existing 'Alex', as the name is stored stripped."""
+        from project_manager import services
+
+        use_backend(User(name="Alex", email="alex@email.com"))
+
+        result = services.add_user("  Alex ", "other@email.com")
+        assert result["success"] is False
+        assert "already exists" in result["message"]
+
+    def test_add_project_success(self, use_backend):
         """add_project should succeed when user exists and project is new."""
         from project_manager import services
 
         user = User(name="Alex", email="alex@email.com")
-        monkeypatch.setattr(services.storage, "load_users", lambda: [user])
-        monkeypatch.setattr(services.storage, "save_users", lambda users: None)
+        use_backend(user)
 
         result = services.add_project("Alex", "New Project")
         assert result["success"] is True
 
-    def test_add_project_user_not_found(self, monkeypatch):
+    def test_add_project_user_not_found(self, use_backend):
         """add_project should fail if user doesn't exist."""
         from project_manager import services
 
-        monkeypatch.setattr(services.storage, "load_users", lambda: [])
-        monkeypatch.setattr(services.storage, "save_users", lambda users: None)
+        use_backend()
 
         result = services.add_project("Ghost", "Some Project")
         assert result["success"] is False
         assert "not found" in result["message"]
 
-    def test_add_task_success(self, monkeypatch):
+    def test_list_users_streams_rows(self, use_backend):
+        """list_users should build its rows from the backend's iter_users."""
+        from project_manager import services
+
+        user = User(name="Alex", email="alex@email.com")
+        use_backend(user)
+
+        assert list(services.list_users_iter()) == [(str(user.id), "Alex", "alex@email.com", "0")]
+        assert services.list_users()["data"] == [(str(user.id), "Alex", "alex@email.com", "0")]
+
+    def test_with_context_accepts_keywords_and_reports_missing(self, use_backend):
+        """Context arguments may be passed by keyword; a missing project should fail."""
+        from project_manager import services
+
+        user = User(name="Alex", email="alex@email.com")
+        user.add_project(Project(title="My Project"))
+        use_backend(user)
+
+        result = services.list_tasks(username="alex", project_title="my project")
+        assert "No tasks found" in result["message"]
+
+        result = services.list_tasks("Alex", "Ghost Project")
+        assert result["message"] == "Project 'Ghost Project' not found for 'Alex'."
+
+    def test_renamed_user_is_found_by_new_name(self, use_backend):
+        """Renaming a user should update the services' name index."""
+        from project_manager import services
+
+        user = User(name="Alex", email="alex@email.com")
+        user.add_project(Project(title="My Project"))
+        use_backend(user)
+        assert services.list_projects("Alex")["success"] is True
+
+        user.name = "Bob"
+        assert services.list_projects("Bob")["success"] is True
+        assert "not found" in services.list_projects("Alex")["message"]
+
+    def test_with_context_missing_argument_raises_type_error(self, use_backend):
+        """A missing leading argument should raise TypeError naming it."""
+        from project_manager import services
+
+        use_backend()
+
+        with pytest.raises(TypeError, match=r"list_tasks\(\) missing required argument: 'project_title'"):
+            services.list_tasks("Alex")
+        with pytest.raises(TypeError, match="'username'"):
+            services.complete_task(project_title="P", task_title="T")
+
+    def test_with_context_rejects_unordered_needs(self):
+        """needs must follow the user → project → task chain."""
+        from project_manager import services
+
+        with pytest.raises(ValueError):
+            services.with_context("project")
+
+    def test_failure_result_is_plain_dict(self, use_backend):
+        """Failures should be ordinary, JSON-serializable dicts."""
+        import json
+        from project_manager import services
+
+        use_backend()
+
+        result = services.list_projects("Ghost")
+        assert type(result) is dict
+        assert json.loads(json.dumps(result)) == {
+            "success": False, "message": "User 'Ghost' not found.", "data": []
+        }
+
+    def test_add_task_success(self, use_backend):
         """add_task should succeed when user and project exist."""
         from project_manager import services
 
@@ -413,13 +602,12 @@ class TestServices:
         project = Project(title="My Project")
         user.add_project(project)
 
-        monkeypatch.setattr(services.storage, "load_users", lambda: [user])
-        monkeypatch.setattr(services.storage, "save_users", lambda users: None)
+        use_backend(user)
 
         result = services.add_task("Alex", "My Project", "Do something")
         assert result["success"] is True
 
-    def test_complete_task_success(self, monkeypatch):
+    def test_complete_task_success(self, use_backend):
         """complete_task should mark the task as complete."""
         from project_manager import services
 
@@ -429,15 +617,15 @@ class TestServices:
         project.add_task(task)
         user.add_project(project)
 
-        monkeypatch.setattr(services.storage, "load_users", lambda: [user])
-        monkeypatch.setattr(services.storage, "save_users", lambda users: None)
+        backend = use_backend(user)
 
         result = services.complete_task("Alex", "My Project", "Fix bug")
         assert result["success"] is True
         assert task.status == "complete"
+        assert backend.changed == [user]
 
-    def test_complete_task_already_complete(self, monkeypatch):
-        """complete_task should fail if task is already complete."""
+    def test_complete_task_already_complete(self, use_backend):
+        """complete_task should fail, without saving, if task is already complete."""
         from project_manager import services
 
         user = User(name="Alex", email="alex@email.com")
@@ -446,9 +634,25 @@ class TestServices:
         project.add_task(task)
         user.add_project(project)
 
-        monkeypatch.setattr(services.storage, "load_users", lambda: [user])
-        monkeypatch.setattr(services.storage, "save_users", lambda users: None)
+        backend = use_backend(user)
 
         result = services.complete_task("Alex", "My Project", "Fix bug")
         assert result["success"] is False
-        assert "already complete" in result["message"]
\ No newline at end of file
+        assert "already complete" in result["message"]
+        assert backend.changed == []
+
+    def test_list_tasks_returns_rows(self, use_backend):
+        """list_tasks should return display-ready row tuples."""
+        from project_manager import services
+
+        user = User(name="Alex", email="alex@email.com")
+        project = Project(title="My Project")
+        task = Task(title="Fix bug")
+        project.add_task(task)
+        user.add_project(project)
+
+        use_backend(user)
+
+        result = services.list_tasks("Alex", "My Project")
+        assert result["success"] is True
+        assert result["data"] == [(str(task.id), "Fix bug", "—", "pending")]
@@ -0,0 +1,434 @@
+"""
+tests/test_storage.py
+Unit tests for the JSON storage layer.
+Tests cover:
+    - Save / load round trips and per-user files
+    - The in-memory cache and its invalidation
+    - Deferred (dirty-flag) saves and atomic writes
+    - Saves racing another process writing the same folder
+    - The pickle snapshot
+
+Every test points storage at a temporary data folder, so the real
+data/ files are never touched.
+
+Run with:
+    pytest tests/test_storage.py -v
+"""
+
+import pytest
+import subprocess
+import sys
+import os
+
+# Make sure the root folder is on the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_manager import storage
+from project_manager.models import User, Project, Task
+
+
+# ─────────────────────────────────────────────
+# FIXTURES — reusable test data
+# ─────────────────────────────────────────────
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Redirect storage to an empty temporary data folder."""
+    (tmp_path / "users").mkdir()  # storage creates the real folder at import
+    monkeypatch.setattr(storage, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(storage, "USERS_DIR", str(tmp_path / "users"))
+    monkeypatch.setattr(storage, "USERS_FILE", str(tmp_path / "users.json"))
+    monkeypatch.setattr(storage, "SNAPSHOT_FILE", str(tmp_path / "users.pickle"))
+    monkeypatch.setattr(storage, "_cache", None)
+    monkeypatch.setattr(storage, "_cache_stamp", None)
+    monkeypatch.setattr(storage, "_file_mtimes", {})
+    monkeypatch.setattr(storage, "_dirty", {})
+    monkeypatch.setattr(storage, "_dirty_count", 0)
+    monkeypatch.setattr(storage, "_dirty_since", None)
+    monkeypatch.setattr(storage, "_flush_registered", True)  # no real atexit hooks from tests
+    monkeypatch.setattr(storage, "_snapshot_registered", True)
+    monkeypatch.setattr(storage, "_snapshot_due", None)
+    return tmp_path
+
+
+def run_other_process(code: str):
+    """Run code in a second Python process whose storage uses the same data folder."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    setup = (
+        f"import sys; sys.path.insert(0, {root!r})\n"
+        "from project_manager import storage, services\n"
+        "from project_manager.models import User\n"
+        f"storage.DATA_DIR = {storage.DATA_DIR!r}\n"
+        f"storage.USERS_DIR = {storage.USERS_DIR!r}\n"
+        f"storage.USERS_FILE = {storage.USERS_FILE!r}\n"
+        f"storage.SNAPSHOT_FILE = {storage.SNAPSHOT_FILE!r}\n"
+    )
+    subprocess.run([sys.executable, "-c", setup + code], check=True)
+
+
+@pytest.fixture
+def sample_users():
+    """Return a small User → Project → Task tree."""
+    user = User(name="Alex", email="alex@email.com")
+    project = Project(title="CLI Tool", due_date="2025-12-31")
+    project.add_task(Task(title="Write tests", assigned_to="Alex"))
+    user.add_project(project)
+    return [user]
+
+
+# ─────────────────────────────────────────────
+# ROUND TRIP TESTS
+# ─────────────────────────────────────────────
+
+class TestRoundTrip:
+    """Tests for saving and loading users."""
+
+    def test_load_missing_file(self, data_dir):
+        """Loading with no users file should return an empty list."""
+        assert storage.load_users() == []
+
+    def test_save_then_load_from_disk(self, data_dir, sample_users, monkeypatch):
+        """Users written to disk should load back with nested data intact."""
+        storage.save_users(sample_users)
+        monkeypatch.setattr(storage, "_cache", None)  # force a real read
+
+        loaded = storage.load_users()
+        assert [u.name for u in loaded] == ["Alex"]
+        assert loaded[0].projects[0].title == "CLI Tool"
+        assert loaded[0].projects[0].tasks[0].title == "Write tests"
+
+    def test_round_trip_without_orjson(self, data_dir, sample_users, monkeypatch):
+        """The stdlib json fallback should read and write the same format."""
+        monkeypatch.setattr(storage, "orjson", None)
+        sample_users[0].name = "Zoë"
+        storage.save_users(sample_users)
+        monkeypatch.setattr(storage, "_cache", None)
+
+        loaded = storage.load_users()
+        assert loaded[0].name == "Zoë"
+        assert loaded[0].projects[0].tasks[0].assigned_to == "Alex"
+
+    def test_iter_users_streams_without_caching(self, data_dir, sample_users, monkeypatch):
+        """iter_users should read the files in ID order and leave the cache empty."""
+        jordan = User(name="Jordan", email="jordan@email.com")
+        storage.save_users(sample_users + [jordan])
+        monkeypatch.setattr(storage, "_cache", None)
+
+        assert [u.name for u in storage.iter_users()] == ["Alex", "Jordan"]
+        assert storage._cache is None
+
+    def test_object_hook_builds_models_while_parsing(self):
+        """The stdlib decoder should hand back a fully built User tree."""
+        raw = (b'{"id": 5, "name": "Alex", "email": "a@email.com", "projects": '
+               b'[{"id": 3, "title": "CLI Tool", "tasks": [{"id": 2, "title": "Docs", "status": "complete"}]}]}')
+        user = storage.json.loads(raw, object_hook=storage._build_model)
+
+        assert isinstance(user, User)
+        project = user.find_project("cli tool")
+        assert project._owner is user
+        assert project.find_task("docs").status == "complete"
+
+    def test_minimal_task_decodes_as_task_without_orjson(self, data_dir, monkeypatch):
+        """A task record with only id and title should still become a Task."""
+        monkeypatch.setattr(storage, "orjson", None)
+        raw = (b'{"id": 1, "name": "Alex", "email": "a@email.com", "projects": '
+               b'[{"id": 2, "title": "CLI Tool", "tasks": [{"id": 3, "title": "T"}]}]}')
+
+        user = storage._loads_users(raw)
+        task = user.projects[0].tasks[0]
+        assert isinstance(task, Task)
+        assert task.status == "pending"
+        assert user.to_dict()["projects"][0]["tasks"][0]["title"] == "T"
+
+    def test_corrupted_file_is_skipped(self, data_dir, sample_users, monkeypatch, capsys):
+        """A malformed user file should be reported and skipped."""
+        storage.save_users(sample_users)
+        with open(os.path.join(storage.USERS_DIR, "999.json"), "w") as f:
+            f.write("{not json")
+        monkeypatch.setattr(storage, "_cache", None)
+
+        assert [u.name for u in storage.load_users()] == ["Alex"]
+        assert "corrupted" in capsys.readouterr().out
+
+    def test_save_user_writes_only_that_user(self, data_dir, sample_users):
+        """save_user should rewrite one file and leave the others alone."""
+        jordan = User(name="Jordan", email="jordan@email.com")
+        users = sample_users + [jordan]
+        storage.save_users(users)
+
+        alex_path = storage._user_path(sample_users[0].id)
+        os.utime(alex_path, ns=(0, 0))
+        storage.save_user(jordan)
+
+        assert os.stat(alex_path).st_mtime_ns == 0
+        assert storage.load_users() is users
+
+    def test_legacy_users_file_is_migrated(self, data_dir):
+        """Users in the old single users.json should load and move to users/."""
+        with open(storage.USERS_FILE, "w") as f:
+            f.write('[{"id": 7, "name": "Jordan", "email": "j@email.com", "projects": []}]')
+
+        assert [u.name for u in storage.load_users()] == ["Jordan"]
+        storage.flush()
+        assert os.path.exists(storage._user_path(7))
+
+
+# ─────────────────────────────────────────────
+# CACHE TESTS
+# ─────────────────────────────────────────────
+
+class TestCache:
+    """Tests for the in-memory users cache."""
+
+    def test_load_after_save_uses_cache(self, data_dir, sample_users):
+        """Loading right after a save should return the saved list itself."""
+        storage.save_users(sample_users)
+        assert storage.load_users() is sample_users
+
+    def test_external_change_invalidates_cache(self, data_dir, sample_users):
+        """A user file added elsewhere should be picked up."""
+        storage.save_users(sample_users)
+
+        path = storage._user_path(999)
+        with open(path, "w") as f:
+            f.write('{"id": 999, "name": "Jordan", "email": "j@email.com", "projects": []}')
+        os.utime(path, ns=(2**62, 2**62))  # make sure the stamp differs
+
+        loaded = storage.load_users()
+        assert sorted(u.name for u in loaded) == ["Alex", "Jordan"]
+
+    def test_change_during_load_is_not_hidden(self, data_dir, sample_users, monkeypatch):
+        """A file written while users are being read should invalidate the cache."""
+        storage.save_users(sample_users)
+        monkeypatch.setattr(storage, "_cache", None)
+        monkeypatch.setattr(storage, "_read_snapshot", lambda stamp: None)
+
+        real_read = storage._read_users
+
+        def read_then_race(path):
+            user = real_read(path)
+            other = storage._user_path(999)
+            with open(other, "w") as f:  # another process adds a user mid-load
+                f.write('{"id": 999, "name": "Jordan", "email": "j@email.com"}')
+            os.utime(other, ns=(2**62, 2**62))
+            return user
+
+        monkeypatch.setattr(storage, "_read_users", read_then_race)
+        assert [u.name for u in storage.load_users()] == ["Alex"]
+
+        monkeypatch.setattr(storage, "_read_users", real_read)
+        assert sorted(u.name for u in storage.load_users()) == ["Alex", "Jordan"]
+
+
+# ─────────────────────────────────────────────
+# DEFERRED SAVE TESTS
+# ─────────────────────────────────────────────
+
+class TestDeferredSave:
+    """Tests for mark_dirty() / flush()."""
+
+    def test_mark_dirty_defers_write(self, data_dir, sample_users):
+        """mark_dirty should not write until flush is called."""
+        storage.mark_dirty(sample_users, sample_users[0])
+        assert not os.path.exists(storage._user_path(sample_users[0].id))
+        assert storage.load_users() is sample_users  # pending changes are visible
+
+        storage.flush()
+        assert os.listdir(storage.USERS_DIR) == [f"{sample_users[0].id}.json"]  # no .tmp left
+
+    def test_flush_after_max_pending_changes(self, data_dir, sample_users, monkeypatch):
+        """Reaching FLUSH_EVERY pending changes should write immediately."""
+        monkeypatch.setattr(storage, "FLUSH_EVERY", 3)
+        storage.mark_dirty(sample_users, sample_users[0])
+        storage.mark_dirty(sample_users, sample_users[0])
+        assert not os.path.exists(storage._user_path(sample_users[0].id))
+
+        storage.mark_dirty(sample_users, sample_users[0])
+        assert os.path.exists(storage._user_path(sample_users[0].id))
+
+    def test_first_mark_dirty_registers_exit_flush(self, data_dir, sample_users, monkeypatch):
+        """Pending changes should be flushed at exit even if the CLI never ran."""
+        registered = []
+        monkeypatch.setattr(storage.atexit, "register", registered.append)
+        monkeypatch.setattr(storage, "_flush_registered", False)
+
+        storage.mark_dirty(sample_users, sample_users[0])
+        storage.mark_dirty(sample_users, sample_users[0])
+        assert registered == [storage.flush]
+
+    def test_failed_write_stays_pending(self, data_dir, sample_users, monkeypatch, capsys):
+        """A user whose file could not be written should be retried, not dropped."""
+        real_write = storage._write_user
+        failures = [OSError("disk full")]
+
+        def flaky_write(user):
+            if failures:
+                raise failures.pop()
+            real_write(user)
+
+        monkeypatch.setattr(storage, "_write_user", flaky_write)
+        storage.mark_dirty(sample_users, sample_users[0])
+
+        storage.flush()
+        assert "disk full" in capsys.readouterr().out
+        assert sample_users[0].id in storage._dirty
+
+        storage.flush()
+        assert not storage._dirty
+        assert os.path.exists(storage._user_path(sample_users[0].id))
+
+    def test_flush_without_changes_is_noop(self, data_dir):
+        """flush with nothing pending should not create any files."""
+        storage.flush()
+        assert os.listdir(storage.USERS_DIR) == []
+
+
+# ─────────────────────────────────────────────
+# CONCURRENT PROCESS TESTS
+# ─────────────────────────────────────────────
+
+class TestOtherProcess:
+    """Tests for flush() when another process writes the folder meanwhile."""
+
+    def test_new_user_does_not_overwrite_other_process_user(self, data_dir):
+        """Two processes creating a user with the same ID should both be kept."""
+        users = storage.load_users()
+        shelly = User(name="Shelly", email="shelly@email.com")
+        users.append(shelly)
+        storage.mark_dirty(users, shelly)
+        taken_id = shelly.id
+
+        run_other_process(  # a one-shot add-user that got the same ID
+            f"storage.save_user(User(name='Other', email='other@email.com', user_id={taken_id}))\n"
+        )
+        storage.flush()
+
+        assert shelly.id != taken_id
+        assert sorted(u.name for u in storage.load_users()) == ["Other", "Shelly"]
+
+    def test_file_changed_by_other_process_is_not_overwritten(self, data_dir, sample_users, capsys):
+        """A pending change to a user someone else has since saved should be reported, not written."""
+        storage.save_users(sample_users)
+        user = storage.load_users()[0]
+        user.email = "mine@email.com"
+        storage.mark_dirty(sample_users, user)
+
+        run_other_process(
+            "user = storage.load_users()[0]\n"
+            "user.email = 'theirs@email.com'\n"
+            "storage.save_user(user)\n"
+        )
+        storage.flush()
+
+        assert "changed by another process" in capsys.readouterr().out
+        assert not storage._dirty
+        assert storage.load_users()[0].email == "theirs@email.com"
+
+    def test_own_flushes_keep_the_cache(self, data_dir, sample_users):
+        """With no other writer, a flush should leave the same list cached."""
+        storage.save_users(sample_users)
+        users = storage.load_users()
+        storage.mark_dirty(users, users[0])
+        storage.flush()
+        assert storage.load_users() is users
+
+
+# ─────────────────────────────────────────────
+# SNAPSHOT TESTS
+# ─────────────────────────────────────────────
+
+class TestSnapshot:
+    """Tests for the pickle snapshot used to skip JSON parsing."""
+
+    def test_cold_load_writes_snapshot_used_next_time(self, data_dir, sample_users, monkeypatch):
+        """A full JSON load should leave a snapshot that the next cold load uses."""
+        storage.save_users(sample_users)
+        monkeypatch.setattr(storage, "_cache", None)
+        storage.load_users()
+        assert not os.path.exists(storage.SNAPSHOT_FILE)  # not until exit
+        storage._write_due_snapshot()
+        assert os.path.exists(storage.SNAPSHOT_FILE)
+
+        monkeypatch.setattr(storage, "_cache", None)
+        monkeypatch.setattr(storage, "_read_users", lambda path: pytest.fail("read JSON"))
+
+        loaded = storage.load_users()
+        assert loaded[0].projects[0].tasks[0].title == "Write tests"
+        assert loaded[0].projects[0]._owner is loaded[0]
+
+    def test_iter_users_uses_current_snapshot(self, data_dir, sample_users, monkeypatch):
+        """Streaming users on a cold start should restore the snapshot, not parse JSON."""
+        storage.save_users(sample_users)
+        monkeypatch.setattr(storage, "_cache", None)
+        storage.load_users()
+        storage._write_due_snapshot()  # what exit does after a read-only run
+
+        monkeypatch.setattr(storage, "_cache", None)
+        monkeypatch.setattr(storage, "_read_users", lambda path: pytest.fail("read JSON"))
+        assert [u.name for u in storage.iter_users()] == ["Alex"]
+
+    def test_saves_do_not_rewrite_snapshot(self, data_dir, sample_users):
+        """Saving or flushing a user should only write that user's file."""
+        storage.save_users(sample_users)
+        storage.mark_dirty(sample_users, sample_users[0])
+        storage.flush()
+        assert not os.path.exists(storage.SNAPSHOT_FILE)
+
+    def test_mutating_loads_do_not_rewrite_snapshot(self, data_dir, sample_users, monkeypatch):
+        """Runs that change data should not re-pickle the tree, however many there are."""
+        storage.save_users(sample_users)
+        for _ in range(2):  # two one-shot mutating runs in a row
+            monkeypatch.setattr(storage, "_cache", None)
+            users = storage.load_users()
+            users[0].email = "new@email.com"
+            storage.mark_dirty(users, users[0])
+            storage.flush()
+            storage._write_due_snapshot()
+
+        assert not os.path.exists(storage.SNAPSHOT_FILE)
+
+    def test_snapshot_leaves_out_dict_cache(self, sample_users):
+        """Cached to_dict() results should not be pickled."""
+        import pickle
+
+        user = sample_users[0]
+        user.to_dict()
+        restored = pickle.loads(pickle.dumps(user, protocol=pickle.HIGHEST_PROTOCOL))
+
+        assert restored._dict_cache is None
+        assert restored.projects[0]._dict_cache is None
+        assert restored.to_dict() == user.to_dict()
+
+    def test_snapshot_is_tagged_with_stamp_from_before_the_read(self, data_dir, sample_users, monkeypatch):
+        """A change made while loading must not be covered by the snapshot's stamp."""
+        storage.save_users(sample_users)
+        monkeypatch.setattr(storage, "_cache", None)
+        before = storage._data_stamp()
+
+        real_read = storage._read_users
+
+        def read_then_touch(path):
+            user = real_read(path)
+            os.utime(path, ns=(2**62, 2**62))  # another process rewrites the file mid-load
+            return user
+
+        monkeypatch.setattr(storage, "_read_users", read_then_touch)
+        storage.load_users()
+        storage._write_due_snapshot()
+        assert storage._read_snapshot(before) is not None
+        assert storage._read_snapshot(storage._data_stamp()) is None
+
+    def test_stale_snapshot_is_ignored(self, data_dir, sample_users, monkeypatch):
+        """A user file changed after the snapshot should win over the snapshot."""
+        storage.save_users(sample_users)
+        monkeypatch.setattr(storage, "_cache", None)
+        storage.load_users()
+        storage._write_due_snapshot()  # what exit does after a read-only run
+
+        path = storage._user_path(sample_users[0].id)
+        with open(path, "w") as f:
+            f.write(f'{{"id": {sample_users[0].id}, "name": "Jordan", "email": "j@email.com"}}')
+        os.utime(path, ns=(2**62, 2**62))
+        monkeypatch.setattr(storage, "_cache", None)
+
+        assert [u.name for u in storage.load_users()] == ["Jordan"]